@@ -1,10 +1,16 @@
+import bisect
+import hashlib
 import json
+import multiprocessing
 import os
 import re
+import threading
 import time
 import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
 from flask import Flask, request, jsonify, render_template, send_from_directory
 from flask_cors import CORS
@@ -14,6 +20,19 @@ import io
 import uuid
 import sys
 
+try:
+    import orjson  # Fast JSON encoder with native NumPy support
+except ImportError:
+    orjson = None
+
+try:
+    import pymupdf  # Fast PDF text extraction (PyPDF2 is the fallback)
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF < 1.24.3
+    except ImportError:
+        pymupdf = None
+
 # Fix JSON serialization for numpy types
 class NumpyEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -37,6 +56,60 @@ sys.path.append(SRC_DIR)
 # Create output directory if it doesn't exist
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), 'outputs')
 os.makedirs(OUTPUT_DIR, exist_ok=True)
+EMBEDDING_CACHE_DIR = os.path.join(os.path.dirname(__file__), '.emb_cache')
+
+# Opt-in int8 ONNX embeddings (faster on CPU, slightly different semantic scores);
+# the full-precision model is the default
+INT8_EMBEDDINGS = os.environ.get('RESUME_MATCHER_INT8_EMBEDDINGS', '').lower() in ('1', 'true', 'yes')
+
+# Parse + embed + match results memoized by content hash of (resume, job) text,
+# so re-submitting the same pair skips the whole analysis
+_ANALYSIS_CACHE_SIZE = 256
+_ANALYSIS_CACHE: "OrderedDict[str, Tuple[Dict, Dict, Dict]]" = OrderedDict()
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+# Debug copies of match results are written off the request path
+_SAVE_POOL = ThreadPoolExecutor(max_workers=1)
+
+# Regex patterns used on every request, compiled once at import
+_EXP_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\+?\s*years?\s+.*?experience',
+    r'experience.*?(\d+)\+?\s*years?',
+    r'(\d+)\+?\s*years?\s+.*?developer',
+    r'(\d+)\+?\s*years?\s+.*?engineer'
+)]
+_JOB_EXP_RE = re.compile(r'(\d+)\+?\s*years?\s+.*?experience', re.IGNORECASE)
+_SAFE_FN_RE = re.compile(r'[^\w\-_]')
+
+# Qualifier words that mark a skill as required or preferred in a job description
+_QUALIFIER_RE = re.compile(
+    r'(?P<required>required|must|essential|requirement)|(?P<preferred>preferred|nice|bonus|plus)'
+)
+
+# Common skills list for fallback parsing
+COMMON_SKILLS = (
+    'python', 'java', 'javascript', 'sql', 'aws', 'azure', 'docker', 
+    'kubernetes', 'machine learning', 'ai', 'deep learning', 'tensorflow',
+    'pytorch', 'git', 'github', 'ci/cd', 'agile', 'scrum', 'rest api',
+    'node.js', 'react', 'angular', 'vue', 'flask', 'django', 'fastapi',
+    'mongodb', 'postgresql', 'mysql', 'redis', 'linux', 'unix', 'bash',
+    'powershell', 'html', 'css', 'typescript', 'c++', 'c#', '.net',
+    'go', 'rust', 'ruby', 'php', 'swift', 'kotlin', 'android', 'ios'
+)
+COMMON_SKILLS_SET = frozenset(COMMON_SKILLS)
+# Single alternation over all skills (longest first); lookarounds instead of \b
+# so skills like 'c++' and '.net' still match at word edges
+_SKILLS_RE = re.compile(
+    r'(?<!\w)(' + '|'.join(re.escape(s) for s in sorted(COMMON_SKILLS_SET, key=lambda s: (-len(s), s))) + r')(?!\w)'
+)
+
+# Keywords marking a resume line as education
+EDUCATION_KEYWORDS = frozenset([
+    'bachelor', 'master', 'phd', 'doctorate', 'degree', 
+    'diploma', 'university', 'college', 'school', 'institute',
+    'bsc', 'msc', 'mba', 'ba', 'bs', 'ma', 'ms'
+])
+_EDUCATION_RE = re.compile(r'\b(' + '|'.join(sorted(EDUCATION_KEYWORDS)) + r')\b', re.IGNORECASE)
 
 # ========== GLOBALLY DEFINED COMPONENTS ==========
 # Initialize these at module level to avoid scope issues
@@ -45,12 +118,19 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 class SimpleDocumentParser:
     @staticmethod
     def parse_pdf(file_stream):
+        if pymupdf is not None:
+            # MuPDF decodes content streams in C; much faster than PyPDF2
+            data = file_stream.read()
+            try:
+                with pymupdf.open(stream=data, filetype='pdf') as doc:
+                    return "\n".join(page.get_text("text") for page in doc)
+            except Exception as e:
+                # PyPDF2 tolerates some files MuPDF rejects
+                print(f"PyMuPDF parsing error: {e}; retrying with PyPDF2")
+            file_stream = io.BytesIO(data)
         try:
             pdf_reader = PyPDF2.PdfReader(file_stream)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            return "\n".join((page.extract_text() or "") for page in pdf_reader.pages)
         except Exception as e:
             print(f"PDF parsing error: {e}")
             return ""
@@ -77,6 +157,189 @@ class SimpleDocumentParser:
 # Initialize simple parser (ALWAYS AVAILABLE)
 simple_parser = SimpleDocumentParser()
 
+# Resume and job description are independent, so they are parsed in parallel
+_PARSE_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Batches smaller than this are extracted on threads rather than processes
+_PROCESS_POOL_MIN_FILES = 10
+
+# Worker processes for extracting large batches, started on first use and then
+# shared by every request (see get_extract_pool)
+_EXTRACT_POOL: Optional[ProcessPoolExecutor] = None
+_EXTRACT_POOL_LOCK = threading.Lock()
+
+# Most files (resumes plus job descriptions) one /batch_upload request may carry
+MAX_BATCH_FILES = 100
+
+def parse_document_bytes(filename: str, data: bytes) -> str:
+    """Extract text from raw upload bytes (module-level so worker processes can run it)"""
+    return get_file_parser(filename)(io.BytesIO(data))
+
+_FILE_PARSERS = {
+    '.pdf': simple_parser.parse_pdf,
+    '.docx': simple_parser.parse_docx,
+    '.txt': simple_parser.parse_text
+}
+
+def get_file_parser(filename: str):
+    """Return the parser for a lowercase filename, or None if the format is unsupported"""
+    return _FILE_PARSERS.get(os.path.splitext(filename)[1])
+
+# Simplified components, used when the AI components cannot be imported or initialized
+class SimpleEmbeddingGenerator:
+    @staticmethod
+    def get_embedding(text: str) -> np.ndarray:
+        """Generate a simple embedding for demo purposes"""
+        if text:
+            # Create deterministic embedding from a stable 64-bit text hash
+            # (hash() is salted per process); a local Generator keeps global
+            # NumPy state untouched (thread-safe)
+            seed = int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+            rng = np.random.default_rng(seed)
+            embedding = rng.standard_normal(384, dtype=np.float32)
+            # Normalize
+            embedding /= np.linalg.norm(embedding)
+            return embedding
+        else:
+            return np.zeros(384, dtype=np.float32)
+    
+    @staticmethod
+    def get_embeddings_batch(texts: List[str]) -> np.ndarray:
+        """Generate embeddings for several texts at once"""
+        return np.stack([SimpleEmbeddingGenerator.get_embedding(text) for text in texts])
+    
+    @staticmethod
+    def get_similarity(emb1: np.ndarray, emb2: np.ndarray) -> float:
+        """Cosine similarity of unit-norm embeddings (see get_normalized_embeddings)"""
+        if emb1 is None or emb2 is None:
+            return 0.0
+        return float(np.dot(emb1, emb2))
+
+class SimpleMatcher:
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        self.weights = weights or {
+            'required_skills': 0.35,
+            'preferred_skills': 0.20,
+            'experience': 0.25,
+            'education': 0.15,
+            'semantic': 0.05
+        }
+    
+    def match(self, resume_data: Dict, job_data: Dict, 
+             resume_embedding: Optional[np.ndarray] = None, 
+             job_embedding: Optional[np.ndarray] = None,
+             semantic_score: Optional[float] = None) -> Dict:
+        
+        resume_skills = resume_data.get('skills', [])
+        job_required = job_data.get('required_skills', [])
+        job_preferred = job_data.get('preferred_skills', [])
+        resume_years = resume_data.get('experience_years', 0)
+        job_years = job_data.get('experience_required', 0)
+        resume_edu = resume_data.get('education', [])
+        job_edu = job_data.get('education_required', [])
+        
+        # Skill matching on normalized sets, same normalization as MatchingEngine.skill_set
+        resume_set = frozenset(' '.join(skill.split()).casefold() for skill in resume_skills)
+        required_set = frozenset(' '.join(skill.split()).casefold() for skill in job_required)
+        preferred_set = frozenset(' '.join(skill.split()).casefold() for skill in job_preferred)
+        
+        required_matches = required_set & resume_set
+        required_score = len(required_matches) / len(required_set) if required_set else 1.0
+        
+        preferred_matches = preferred_set & resume_set
+        preferred_score = len(preferred_matches) / len(preferred_set) if preferred_set else 1.0
+        
+        if required_set:
+            skill_score = (required_score * 0.7) + (preferred_score * 0.3)
+        else:
+            skill_score = preferred_score
+        
+        # Experience matching
+        if job_years == 0:
+            exp_score = 1.0
+        elif resume_years >= job_years:
+            excess_years = resume_years - job_years
+            bonus = min(excess_years * 0.1, 0.3)
+            exp_score = 1.0 + bonus
+        else:
+            base_score = resume_years / job_years
+            exp_score = base_score * 0.8 if base_score < 0.5 else base_score
+        
+        # Education matching
+        if not job_edu:
+            edu_score = 1.0
+        elif not resume_edu:
+            edu_score = 0.0
+        else:
+            resume_lower = [e.lower() for e in resume_edu]
+            job_lower = [e.lower() for e in job_edu]
+            # Substring checks against joined strings instead of a nested pairwise loop
+            resume_joined = ' | '.join(resume_lower)
+            job_joined = ' | '.join(job_lower)
+            
+            if (any(required in resume_joined for required in job_lower) or
+                    any(edu in job_joined for edu in resume_lower)):
+                edu_score = 1.0
+            else:
+                edu_score = 0.5
+        
+        # Semantic similarity (embeddings are unit-norm, so cosine is a dot product)
+        if semantic_score is None:
+            semantic_score = 0.0
+            if resume_embedding is not None and job_embedding is not None:
+                semantic_score = float(np.dot(resume_embedding, job_embedding))
+        
+        # Overall score
+        overall_score = (
+            self.weights['required_skills'] * required_score +
+            self.weights['preferred_skills'] * preferred_score +
+            self.weights['experience'] * min(exp_score, 1.3) +
+            self.weights['education'] * edu_score +
+            self.weights['semantic'] * semantic_score
+        ) * 100
+        
+        result = {
+            'overall_score': float(min(max(overall_score, 0), 100)),
+            'skill_score': float(skill_score * 100),
+            'experience_score': float(min(exp_score, 1.3) * 100),
+            'education_score': float(edu_score * 100),
+            'semantic_score': float(semantic_score * 100),
+            'skill_details': {
+                'score': float(skill_score * 100),
+                'required_matches': list(required_matches),
+                'preferred_matches': list(preferred_matches),
+                'missing_required': list(required_set - resume_set),
+                'missing_preferred': list(preferred_set - resume_set),
+                'required_coverage': f"{len(required_matches)}/{len(job_required)}",
+                'preferred_coverage': f"{len(preferred_matches)}/{len(job_preferred)}"
+            },
+            'match_breakdown': {
+                'skills_match': f"{len(required_matches)}/{len(job_required)} required skills",
+                'experience_match': f"{resume_years}/{job_years} years",
+                'education_match': "Exceeds" if edu_score > 1.0 else ("Meets" if edu_score >= 0.8 else "Partial"),
+                'semantic_match': f"{semantic_score:.2%}"
+            }
+        }
+        
+        return result
+
+class SimpleAIExplainer:
+    # Explanation by overall score: bisect_right(THRESHOLDS, score) indexes MESSAGES
+    THRESHOLDS = (60, 70, 80, 90)
+    MESSAGES = (
+        "❌ **POOR MATCH** - Significant gaps between candidate and job requirements.\n**Issues:** Missing critical required skills or insufficient experience.\n**Recommendation:** Not recommended for this role.",
+        "📊 **FAIR MATCH** - Candidate meets basic requirements but has significant gaps.\n**Strengths:** Has some required skills and meets minimum experience.\n**Gaps:** Missing critical required skills.\n**Recommendation:** Consider as backup candidate.",
+        "⚠️ **GOOD MATCH** - Candidate has relevant experience with some skill gaps.\n**Strengths:** Has most required skills and meets experience requirements.\n**Gaps:** Missing some preferred skills.\n**Recommendation:** Consider if other candidates are unavailable.",
+        "✅ **STRONG MATCH** - Candidate meets most requirements with excellent core skills.\n**Strengths:** Strong foundation in key required areas.\n**Recommendation:** Strong candidate worth interviewing.",
+        "🎯 **EXCELLENT MATCH** - This candidate strongly aligns with all job requirements.\n**Key Strengths:** Complete skill overlap, exceeds experience requirements.\n**Recommendation:** Highly recommended for immediate interview consideration."
+    )
+    
+    @staticmethod
+    def generate_match_explanation(resume_data: Dict, job_data: Dict, match_result: Dict,
+                                   generated_at: Optional[datetime] = None) -> str:
+        score = match_result.get('overall_score', 0)
+        return SimpleAIExplainer.MESSAGES[bisect.bisect_right(SimpleAIExplainer.THRESHOLDS, score)]
+
 # Try to import AI components
 USE_AI_COMPONENTS = False
 ai_parser = None
@@ -92,8 +355,8 @@ try:
     
     # Initialize AI components
     ai_parser = AIDocumentParser()
-    ai_embedder = EmbeddingGenerator()
-    ai_matcher = MatchingEngine()
+    ai_embedder = EmbeddingGenerator(cache_dir=EMBEDDING_CACHE_DIR, quantized=INT8_EMBEDDINGS)
+    ai_matcher = MatchingEngine(prenormalized=True)
     ai_explainer = AIExplainer()
     
     print("✅ AI backend components initialized successfully")
@@ -103,170 +366,6 @@ except ImportError as e:
     print(f"⚠️ Failed to import AI components: {e}")
     print("⚠️ Will use simplified components instead")
     
-    # Define fallback components
-    class SimpleEmbeddingGenerator:
-        @staticmethod
-        def get_embedding(text: str) -> np.ndarray:
-            """Generate a simple embedding for demo purposes"""
-            words = re.findall(r'\b\w+\b', text.lower())
-            unique_words = list(set(words[:100]))
-            
-            if len(unique_words) > 0:
-                # Create deterministic embedding based on text hash
-                seed = hash(text) % 10000
-                np.random.seed(seed)
-                embedding = np.random.randn(384).astype(np.float32)
-                # Normalize
-                norm = np.linalg.norm(embedding)
-                if norm > 0:
-                    embedding = embedding / norm
-                return embedding
-            else:
-                return np.zeros(384, dtype=np.float32)
-        
-        @staticmethod
-        def get_similarity(emb1: np.ndarray, emb2: np.ndarray) -> float:
-            if emb1 is None or emb2 is None:
-                return 0.0
-            dot = np.dot(emb1, emb2)
-            norm1 = np.linalg.norm(emb1)
-            norm2 = np.linalg.norm(emb2)
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            return float(dot / (norm1 * norm2))
-    
-    class SimpleMatcher:
-        def __init__(self, weights: Optional[Dict[str, float]] = None):
-            self.weights = weights or {
-                'required_skills': 0.35,
-                'preferred_skills': 0.20,
-                'experience': 0.25,
-                'education': 0.15,
-                'semantic': 0.05
-            }
-        
-        def match(self, resume_data: Dict, job_data: Dict, 
-                 resume_embedding: Optional[np.ndarray] = None, 
-                 job_embedding: Optional[np.ndarray] = None) -> Dict:
-            
-            resume_skills = resume_data.get('skills', [])
-            job_required = job_data.get('required_skills', [])
-            job_preferred = job_data.get('preferred_skills', [])
-            resume_years = resume_data.get('experience_years', 0)
-            job_years = job_data.get('experience_required', 0)
-            resume_edu = resume_data.get('education', [])
-            job_edu = job_data.get('education_required', [])
-            
-            # Skill matching
-            resume_set = set(skill.lower().strip() for skill in resume_skills)
-            required_set = set(skill.lower().strip() for skill in job_required)
-            preferred_set = set(skill.lower().strip() for skill in job_preferred)
-            
-            required_matches = resume_set.intersection(required_set)
-            required_score = len(required_matches) / len(required_set) if required_set else 1.0
-            
-            preferred_matches = resume_set.intersection(preferred_set)
-            preferred_score = len(preferred_matches) / len(preferred_set) if preferred_set else 1.0
-            
-            if required_set:
-                skill_score = (required_score * 0.7) + (preferred_score * 0.3)
-            else:
-                skill_score = preferred_score
-            
-            # Experience matching
-            if job_years == 0:
-                exp_score = 1.0
-            elif resume_years >= job_years:
-                excess_years = resume_years - job_years
-                bonus = min(excess_years * 0.1, 0.3)
-                exp_score = 1.0 + bonus
-            else:
-                base_score = resume_years / job_years
-                exp_score = base_score * 0.8 if base_score < 0.5 else base_score
-            
-            # Education matching
-            if not job_edu:
-                edu_score = 1.0
-            elif not resume_edu:
-                edu_score = 0.0
-            else:
-                resume_lower = [e.lower() for e in resume_edu]
-                job_lower = [e.lower() for e in job_edu]
-                
-                for edu in resume_lower:
-                    for required in job_lower:
-                        if required in edu or edu in required:
-                            edu_score = 1.0
-                            break
-                    else:
-                        continue
-                    break
-                else:
-                    edu_score = 0.5
-            
-            # Semantic similarity
-            semantic_score = 0.0
-            if resume_embedding is not None and job_embedding is not None:
-                dot = np.dot(resume_embedding, job_embedding)
-                norm1 = np.linalg.norm(resume_embedding)
-                norm2 = np.linalg.norm(job_embedding)
-                if norm1 > 0 and norm2 > 0:
-                    semantic_score = dot / (norm1 * norm2)
-            
-            # Overall score
-            overall_score = (
-                self.weights['required_skills'] * required_score +
-                self.weights['preferred_skills'] * preferred_score +
-                self.weights['experience'] * min(exp_score, 1.3) +
-                self.weights['education'] * edu_score +
-                self.weights['semantic'] * semantic_score
-            ) * 100
-            
-            result = {
-                'overall_score': float(min(max(overall_score, 0), 100)),
-                'skill_score': float(skill_score * 100),
-                'experience_score': float(min(exp_score, 1.3) * 100),
-                'education_score': float(edu_score * 100),
-                'semantic_score': float(semantic_score * 100),
-                'skill_details': {
-                    'score': float(skill_score * 100),
-                    'required_matches': list(required_matches),
-                    'preferred_matches': list(preferred_matches),
-                    'missing_required': list(required_set - resume_set),
-                    'missing_preferred': list(preferred_set - resume_set),
-                    'required_coverage': f"{len(required_matches)}/{len(job_required)}",
-                    'preferred_coverage': f"{len(preferred_matches)}/{len(job_preferred)}"
-                },
-                'match_breakdown': {
-                    'skills_match': f"{len(required_matches)}/{len(job_required)} required skills",
-                    'experience_match': f"{resume_years}/{job_years} years",
-                    'education_match': "Exceeds" if edu_score > 1.0 else ("Meets" if edu_score >= 0.8 else "Partial"),
-                    'semantic_match': f"{semantic_score:.2%}"
-                }
-            }
-            
-            return result
-    
-    class SimpleAIExplainer:
-        @staticmethod
-        def generate_match_explanation(resume_data: Dict, job_data: Dict, match_result: Dict) -> str:
-            score = match_result.get('overall_score', 0)
-            skill_details = match_result.get('skill_details', {})
-            
-            required_matches = skill_details.get('required_matches', [])
-            missing_required = skill_details.get('missing_required', [])
-            
-            if score >= 90:
-                return "🎯 **EXCELLENT MATCH** - This candidate strongly aligns with all job requirements.\n**Key Strengths:** Complete skill overlap, exceeds experience requirements.\n**Recommendation:** Highly recommended for immediate interview consideration."
-            elif score >= 80:
-                return "✅ **STRONG MATCH** - Candidate meets most requirements with excellent core skills.\n**Strengths:** Strong foundation in key required areas.\n**Recommendation:** Strong candidate worth interviewing."
-            elif score >= 70:
-                return "⚠️ **GOOD MATCH** - Candidate has relevant experience with some skill gaps.\n**Strengths:** Has most required skills and meets experience requirements.\n**Gaps:** Missing some preferred skills.\n**Recommendation:** Consider if other candidates are unavailable."
-            elif score >= 60:
-                return "📊 **FAIR MATCH** - Candidate meets basic requirements but has significant gaps.\n**Strengths:** Has some required skills and meets minimum experience.\n**Gaps:** Missing critical required skills.\n**Recommendation:** Consider as backup candidate."
-            else:
-                return "❌ **POOR MATCH** - Significant gaps between candidate and job requirements.\n**Issues:** Missing critical required skills or insufficient experience.\n**Recommendation:** Not recommended for this role."
-    
     # Initialize fallback components
     ai_embedder = SimpleEmbeddingGenerator()
     ai_matcher = SimpleMatcher()
@@ -274,16 +373,12 @@ except ImportError as e:
 
 except Exception as e:
     print(f"⚠️ Error initializing components: {e}")
-    # Ensure fallback components are defined
+    # Replace whichever components failed to initialize with the simplified ones
     if ai_embedder is None:
-        # Define minimal fallback
-        class SimpleEmbeddingGenerator:
-            @staticmethod
-            def get_embedding(text: str) -> np.ndarray:
-                return np.zeros(384, dtype=np.float32)
-        
         ai_embedder = SimpleEmbeddingGenerator()
+    if ai_matcher is None:
         ai_matcher = SimpleMatcher()
+    if ai_explainer is None:
         ai_explainer = SimpleAIExplainer()
 
 # ========== ROUTES ==========
@@ -318,93 +413,61 @@ def upload_and_match():
         if not job_file and not job_text_input:
             return jsonify({'error': 'Please provide job description (upload file or enter text)'}), 400
         
-        # Parse resume file
+        # Resolve parsers up front so both documents can be parsed concurrently
         resume_filename = resume_file.filename.lower()
-        resume_file_stream = io.BytesIO(resume_file.read())
-        resume_file.seek(0)  # Reset for AI parser if needed
-        
-        if resume_filename.endswith('.pdf'):
-            resume_text = simple_parser.parse_pdf(resume_file_stream)
-        elif resume_filename.endswith('.docx'):
-            resume_text = simple_parser.parse_docx(resume_file_stream)
-        elif resume_filename.endswith('.txt'):
-            resume_text = simple_parser.parse_text(resume_file_stream)
-        else:
+        resume_parse = get_file_parser(resume_filename)
+        if resume_parse is None:
             return jsonify({'error': 'Unsupported resume file format. Use PDF, DOCX, or TXT'}), 400
         
-        if not resume_text or len(resume_text.strip()) < 10:
-            return jsonify({'error': 'Resume file is empty or could not be parsed'}), 400
+        job_parse = None
+        if job_file:
+            job_filename = job_file.filename.lower()
+            job_parse = get_file_parser(job_filename)
+            if job_parse is None:
+                return jsonify({'error': 'Unsupported job description file format. Use PDF, DOCX, or TXT'}), 400
+        
+        # Parse resume file
+        resume_file_stream = io.BytesIO(resume_file.stream.read())
+        resume_future = _PARSE_POOL.submit(resume_parse, resume_file_stream)
         
         # Get job description text (from file or text input)
         job_desc_text = ""
         job_source = "text_input"  # Track source for response
         
         if job_file:
-            # Parse job description file
-            job_filename = job_file.filename.lower()
-            job_file_stream = io.BytesIO(job_file.read())
-            job_file.seek(0)  # Reset for AI parser
-            
-            if job_filename.endswith('.pdf'):
-                job_desc_text = simple_parser.parse_pdf(job_file_stream)
-            elif job_filename.endswith('.docx'):
-                job_desc_text = simple_parser.parse_docx(job_file_stream)
-            elif job_filename.endswith('.txt'):
-                job_desc_text = simple_parser.parse_text(job_file_stream)
-            else:
-                return jsonify({'error': 'Unsupported job description file format. Use PDF, DOCX, or TXT'}), 400
-            
+            # Parse job description file alongside the resume
+            job_file_stream = io.BytesIO(job_file.stream.read())
+            job_future = _PARSE_POOL.submit(job_parse, job_file_stream)
             job_source = "file_upload"
         else:
             # Use text input
+            job_future = None
             job_desc_text = job_text_input
             job_source = "text_input"
         
+        resume_text = resume_future.result()
+        if job_future is not None:
+            job_desc_text = job_future.result()
+        
+        if not resume_text or len(resume_text.strip()) < 10:
+            return jsonify({'error': 'Resume file is empty or could not be parsed'}), 400
+        
         if not job_desc_text or len(job_desc_text.strip()) < 10:
             return jsonify({'error': 'Job description is too short or empty'}), 400
         
         print(f"📊 Text lengths: Resume={len(resume_text)} chars, Job={len(job_desc_text)} chars (Source: {job_source})")
         
-        # Use AI components if available, otherwise use fallback
-        if USE_AI_COMPONENTS and ai_parser is not None:
-            print("🤖 Using AI backend components for parsing and matching...")
-            
-            try:
-                # Parse with AI Document Parser
-                resume_data = ai_parser.parse_resume(resume_text)
-                job_data = ai_parser.parse_job_description(job_desc_text)
-                
-                # Generate embeddings
-                resume_embedding = ai_embedder.get_embedding(resume_text[:1000])
-                job_embedding = ai_embedder.get_embedding(job_desc_text[:1000])
-                
-            except Exception as ai_error:
-                print(f"⚠️ AI parsing failed, using fallback: {ai_error}")
-                resume_data, job_data = fallback_parsing(resume_text, job_desc_text)
-                resume_embedding = ai_embedder.get_embedding(resume_text[:1000])
-                job_embedding = ai_embedder.get_embedding(job_desc_text[:1000])
-        else:
-            print("⚠️ Using fallback parsing...")
-            resume_data, job_data = fallback_parsing(resume_text, job_desc_text)
-            resume_embedding = ai_embedder.get_embedding(resume_text[:1000])
-            job_embedding = ai_embedder.get_embedding(job_desc_text[:1000])
+        resume_data, job_data, match_result = analyze_texts(resume_text, job_desc_text)
         
-        print(f"🔍 Parsed: Resume skills={len(resume_data.get('skills', []))}, "
-              f"Job required={len(job_data.get('required_skills', []))}")
-        
-        # Perform matching
-        match_result = ai_matcher.match(
-            resume_data=resume_data,
-            job_data=job_data,
-            resume_embedding=resume_embedding,
-            job_embedding=job_embedding
-        )
+        # One clock read stamps both the explanation and the saved result
+        now = datetime.now()
         
         # Generate AI explanation
         explanation = ai_explainer.generate_match_explanation(
             resume_data=resume_data,
             job_data=job_data,
-            match_result=match_result
+            match_result=match_result,
+            generated_at=now
         )
         
         # Create response
@@ -433,12 +496,12 @@ def upload_and_match():
             'match_quality': get_match_quality(match_result['overall_score'])
         }
         
-        # Save to file for debugging
-        save_match_result(response_data, resume_file.filename)
+        # Save to file for debugging (in the background)
+        _SAVE_POOL.submit(save_match_result, response_data, resume_file.filename, now)
         
         print(f"✅ Matching completed successfully. Score: {match_result['overall_score']:.1f}%")
         
-        return jsonify(response_data)
+        return json_response(response_data)
         
     except Exception as e:
         print(f"❌ Error in upload_and_match: {str(e)}")
@@ -447,42 +510,266 @@ def upload_and_match():
             'error': f'Server error: {str(e)}',
             'details': traceback.format_exc() if app.debug else None
         }), 500
-    
+
+
+@app.route('/batch_upload', methods=['POST'])
+def batch_upload_and_match():
+    """Match N resumes against M job descriptions in one request"""
+    try:
+        resume_files = request.files.getlist('resumes')
+        job_files = request.files.getlist('job_descriptions')
+        job_text_input = request.form.get('job_text', '').strip()
+        min_required_matches = request.form.get('min_required_matches', 0, type=int)
+        
+        if not resume_files:
+            return jsonify({'error': 'At least one resume file is required'}), 400
+        if not job_files and not job_text_input:
+            return jsonify({'error': 'Please provide job descriptions (upload files or enter text)'}), 400
+        
+        if len(resume_files) + len(job_files) > MAX_BATCH_FILES:
+            return jsonify({'error': f'Too many files: at most {MAX_BATCH_FILES} resumes and job descriptions per batch'}), 400
+        
+        for uploaded in resume_files + job_files:
+            if get_file_parser(uploaded.filename.lower()) is None:
+                return jsonify({'error': f'Unsupported file format: {uploaded.filename}. Use PDF, DOCX, or TXT'}), 400
+        
+        payloads = [(f.filename.lower(), f.stream.read()) for f in resume_files + job_files]
+        texts = extract_texts(payloads)
+        
+        resume_texts = texts[:len(resume_files)]
+        job_texts = texts[len(resume_files):]
+        job_names = [f.filename for f in job_files]
+        if job_text_input:
+            job_texts.append(job_text_input)
+            job_names.append('text_input')
+        
+        for name, text in zip([f.filename for f in resume_files] + job_names, resume_texts + job_texts):
+            if not text or len(text.strip()) < 10:
+                return jsonify({'error': f'{name} is empty or could not be parsed'}), 400
+        
+        print(f"📥 Batch matching {len(resume_texts)} resumes against {len(job_texts)} jobs")
+        
+        scored = match_documents(resume_texts, job_texts, min_required_matches)
+        qualities = get_match_qualities([match_result['overall_score'] for _, _, match_result in scored])
+        
+        matches = []
+        for (i, j, match_result), match_quality in zip(scored, qualities):
+            matches.append({
+                'resume_index': i,
+                'job_index': j,
+                'resume_filename': resume_files[i].filename,
+                'job_filename': job_names[j],
+                'match_score': match_result['overall_score'],
+                'match_quality': match_quality,
+                'match_result': match_result
+            })
+        
+        matches.sort(key=lambda m: m['match_score'], reverse=True)
+        
+        print(f"✅ Batch matching completed: {len(matches)} pairs scored")
+        
+        return json_response({
+            'success': True,
+            'ai_components_used': USE_AI_COMPONENTS,
+            'resume_count': len(resume_texts),
+            'job_count': len(job_texts),
+            'matches': matches
+        })
+        
+    except Exception as e:
+        print(f"❌ Error in batch_upload_and_match: {str(e)}")
+        print(traceback.format_exc())
+        return jsonify({
+            'error': f'Server error: {str(e)}',
+            'details': traceback.format_exc() if app.debug else None
+        }), 500
 
     
 # ========== HELPER FUNCTIONS ==========
+def extract_texts(payloads: List[Tuple[str, bytes]]) -> List[str]:
+    """
+    Extract text from (lowercase filename, bytes) pairs in parallel.
+    
+    Extraction is CPU-bound, so large batches go to the shared worker
+    processes; below _PROCESS_POOL_MIN_FILES copying the files to them
+    outweighs the gain and threads are used instead.
+    """
+    if not payloads:
+        return []
+    if len(payloads) >= _PROCESS_POOL_MIN_FILES:
+        # chunksize batches process round-trips
+        return list(get_extract_pool().map(parse_document_bytes, *zip(*payloads), chunksize=4))
+    with ThreadPoolExecutor(max_workers=len(payloads)) as pool:
+        return list(pool.map(parse_document_bytes, *zip(*payloads)))
+
+def get_extract_pool() -> ProcessPoolExecutor:
+    """
+    The shared text extraction process pool, created on first use.
+    
+    Workers are spawned rather than forked: the server is multithreaded and
+    may hold model state, which a forked child would inherit in an unknown
+    state.
+    """
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is None:
+            _EXTRACT_POOL = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                mp_context=multiprocessing.get_context('spawn'))
+        return _EXTRACT_POOL
+
+def match_documents(resume_texts: List[str], job_texts: List[str],
+                    min_required_matches: int = 0) -> List[Tuple[int, int, Dict]]:
+    """
+    Match every resume against every job description.
+    
+    Each document is parsed and embedded once, however many pairs it takes
+    part in. With min_required_matches > 0, jobs sharing fewer required skills
+    with a resume are skipped before any cosine work.
+    
+    Returns (resume_index, job_index, match_result) tuples in pair order.
+    """
+    if USE_AI_COMPONENTS and ai_parser is not None:
+        try:
+            resumes_data = [ai_parser.parse_resume(text) for text in resume_texts]
+            jobs_data = [ai_parser.parse_job_description(text) for text in job_texts]
+        except Exception as ai_error:
+            print(f"⚠️ AI parsing failed, using fallback: {ai_error}")
+            resumes_data = [fallback_parsing(text, "")[0] for text in resume_texts]
+            jobs_data = [fallback_parsing("", text)[1] for text in job_texts]
+    else:
+        resumes_data = [fallback_parsing(text, "")[0] for text in resume_texts]
+        jobs_data = [fallback_parsing("", text)[1] for text in job_texts]
+    
+    # Normalize skill sets once per document rather than once per pair
+    if hasattr(ai_matcher, 'prepare_skill_sets'):
+        for data in resumes_data + jobs_data:
+            ai_matcher.prepare_skill_sets(data)
+    
+    embeddings = get_normalized_embeddings([text[:1000] for text in resume_texts + job_texts])
+    resume_matrix = np.stack(embeddings[:len(resume_texts)])
+    job_matrix = np.stack(embeddings[len(resume_texts):])
+    
+    pairs = None
+    if min_required_matches > 0 and hasattr(ai_matcher, 'shortlist'):
+        # Drop jobs below the required-skill threshold first; cosine only for survivors
+        try:
+            pairs = [(i, j, semantic_score)
+                     for i, resume_data in enumerate(resumes_data)
+                     for j, semantic_score in ai_matcher.shortlist(
+                         resume_data, jobs_data, min_required_matches, resume_matrix[i], job_matrix)]
+        except Exception as ai_error:
+            print(f"⚠️ AI shortlisting failed, scoring every pair: {ai_error}")
+    if pairs is None:
+        # All pairwise cosine similarities in a single matrix product
+        if hasattr(ai_matcher, 'calculate_similarity_matrix'):
+            similarities = ai_matcher.calculate_similarity_matrix(resume_matrix, job_matrix)
+        else:
+            similarities = resume_matrix @ job_matrix.T
+        pairs = [(i, j, float(similarities[i, j]))
+                 for i in range(len(resumes_data)) for j in range(len(jobs_data))]
+        if min_required_matches > 0:
+            pairs = [(i, j, semantic_score) for i, j, semantic_score in pairs
+                     if meets_required_skills(resumes_data[i], jobs_data[j], min_required_matches)]
+    
+    return [(i, j, ai_matcher.match(resume_data=resumes_data[i],
+                                    job_data=jobs_data[j],
+                                    semantic_score=semantic_score))
+            for i, j, semantic_score in pairs]
+
+def meets_required_skills(resume_data: Dict, job_data: Dict, min_required: int) -> bool:
+    """
+    MatchingEngine.shortlist's filter for matchers without one: whether the
+    resume has at least min_required of the job's required skills (compared
+    after whitespace/case normalization). Jobs without required skills pass.
+    """
+    required = {' '.join(skill.split()).casefold() for skill in job_data.get('required_skills', [])}
+    if not required:
+        return True
+    resume_skills = {' '.join(skill.split()).casefold() for skill in resume_data.get('skills', [])}
+    return len(required & resume_skills) >= min_required
+
+def analyze_texts(resume_text: str, job_desc_text: str) -> Tuple[Dict, Dict, Dict]:
+    """
+    Parse, embed and match a resume/job pair, memoized on a hash of both texts.
+    
+    Returns (resume_data, job_data, match_result); cached results are shared,
+    so callers must not mutate them.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(resume_text.encode())
+    digest.update(b'\0')
+    digest.update(job_desc_text.encode())
+    key = digest.hexdigest()
+    
+    with _ANALYSIS_CACHE_LOCK:
+        cached = _ANALYSIS_CACHE.get(key)
+        if cached is not None:
+            _ANALYSIS_CACHE.move_to_end(key)
+    if cached is not None:
+        print("♻️ Reusing cached analysis for identical resume/job texts")
+        return cached
+    
+    # Use AI components if available, otherwise use fallback
+    if USE_AI_COMPONENTS and ai_parser is not None:
+        print("🤖 Using AI backend components for parsing and matching...")
+        
+        try:
+            # Parse with AI Document Parser
+            resume_data = ai_parser.parse_resume(resume_text)
+            job_data = ai_parser.parse_job_description(job_desc_text)
+            
+        except Exception as ai_error:
+            print(f"⚠️ AI parsing failed, using fallback: {ai_error}")
+            resume_data, job_data = fallback_parsing(resume_text, job_desc_text)
+    else:
+        print("⚠️ Using fallback parsing...")
+        resume_data, job_data = fallback_parsing(resume_text, job_desc_text)
+    
+    # Generate embeddings
+    resume_embedding, job_embedding = get_normalized_embeddings(
+        [resume_text[:1000], job_desc_text[:1000]])
+    
+    print(f"🔍 Parsed: Resume skills={len(resume_data.get('skills', []))}, "
+          f"Job required={len(job_data.get('required_skills', []))}")
+    
+    # Perform matching
+    match_result = ai_matcher.match(
+        resume_data=resume_data,
+        job_data=job_data,
+        resume_embedding=resume_embedding,
+        job_embedding=job_embedding
+    )
+    
+    result = (resume_data, job_data, match_result)
+    with _ANALYSIS_CACHE_LOCK:
+        _ANALYSIS_CACHE[key] = result
+        while len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+    return result
+
+def get_normalized_embeddings(texts: List[str]) -> List[np.ndarray]:
+    """
+    Get unit-norm embeddings for texts; all matcher inputs come from here, so
+    cosine similarity is a plain dot product. Distinct texts are encoded
+    together in one batch; the embedder's disk cache serves repeats.
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    embeddings = np.asarray(ai_embedder.get_embeddings_batch(unique_texts), dtype=np.float32)
+    embeddings = embeddings / (np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12)
+    by_text = dict(zip(unique_texts, embeddings))
+    return [by_text[text] for text in texts]
+
 def fallback_parsing(resume_text: str, job_text: str) -> tuple:
     """Fallback parsing if AI components fail"""
     
-    # Common skills list
-    common_skills = [
-        'python', 'java', 'javascript', 'sql', 'aws', 'azure', 'docker', 
-        'kubernetes', 'machine learning', 'ai', 'deep learning', 'tensorflow',
-        'pytorch', 'git', 'github', 'ci/cd', 'agile', 'scrum', 'rest api',
-        'node.js', 'react', 'angular', 'vue', 'flask', 'django', 'fastapi',
-        'mongodb', 'postgresql', 'mysql', 'redis', 'linux', 'unix', 'bash',
-        'powershell', 'html', 'css', 'typescript', 'c++', 'c#', '.net',
-        'go', 'rust', 'ruby', 'php', 'swift', 'kotlin', 'android', 'ios'
-    ]
-    
-    # Parse resume
+    # Parse resume: one pass of the skill alternation over the text
     resume_lower = resume_text.lower()
-    extracted_skills = []
-    for skill in common_skills:
-        if skill in resume_lower:
-            extracted_skills.append(skill)
+    extracted_skills = list(dict.fromkeys(m.group(1) for m in _SKILLS_RE.finditer(resume_lower)))
     
     # Extract experience years from resume
-    exp_patterns = [
-        r'(\d+)\+?\s*years?\s+.*?experience',
-        r'experience.*?(\d+)\+?\s*years?',
-        r'(\d+)\+?\s*years?\s+.*?developer',
-        r'(\d+)\+?\s*years?\s+.*?engineer'
-    ]
-    
     experience_years = 0
-    for pattern in exp_patterns:
-        matches = re.findall(pattern, resume_text, re.IGNORECASE)
+    for pattern in _EXP_PATTERNS:
+        matches = pattern.findall(resume_text)
         for match in matches:
             if isinstance(match, tuple):
                 match = match[0]
@@ -493,12 +780,9 @@ def fallback_parsing(resume_text: str, job_text: str) -> tuple:
                     break
     
     # Extract education from resume
-    education_keywords = ['bachelor', 'master', 'phd', 'doctorate', 'degree', 
-                         'diploma', 'university', 'college', 'school', 'institute',
-                         'bsc', 'msc', 'mba', 'ba', 'bs', 'ma', 'ms']
     education_lines = []
     for line in resume_text.split('\n'):
-        if any(keyword in line.lower() for keyword in education_keywords):
+        if _EDUCATION_RE.search(line):
             education_lines.append(line.strip())
     
     resume_data = {
@@ -513,25 +797,38 @@ def fallback_parsing(resume_text: str, job_text: str) -> tuple:
     job_required = []
     job_preferred = []
     
-    for skill in common_skills:
-        if skill in job_lower:
-            # Check context to determine if required or preferred
-            skill_pos = job_lower.find(skill)
-            context = job_lower[max(0, skill_pos-50):min(len(job_lower), skill_pos+len(skill)+50)]
-            
-            if any(word in context for word in ['required', 'must', 'essential', 'requirement']):
-                job_required.append(skill)
-            elif any(word in context for word in ['preferred', 'nice', 'bonus', 'plus']):
-                job_preferred.append(skill)
-            else:
-                job_required.append(skill)  # Default to required
+    # Locate every required/preferred qualifier in a single pass
+    qualifiers = [(m.start(), m.end(), m.lastgroup) for m in _QUALIFIER_RE.finditer(job_lower)]
+    qualifier_starts = [q[0] for q in qualifiers]
+    
+    seen_skills = set()
+    for match in _SKILLS_RE.finditer(job_lower):
+        skill = match.group(1)
+        if skill in seen_skills:
+            continue
+        seen_skills.add(skill)
+        
+        # Check qualifiers inside the ±50 char window around the first occurrence
+        skill_pos = match.start()
+        start = max(0, skill_pos-50)
+        end = min(len(job_lower), skill_pos+len(skill)+50)
+        lo = bisect.bisect_left(qualifier_starts, start)
+        hi = bisect.bisect_left(qualifier_starts, end)
+        kinds = {kind for _, q_end, kind in qualifiers[lo:hi] if q_end <= end}
+        
+        if 'required' in kinds:
+            job_required.append(skill)
+        elif 'preferred' in kinds:
+            job_preferred.append(skill)
+        else:
+            job_required.append(skill)  # Default to required
     
     # Remove duplicates
     job_required = list(set(job_required))
     job_preferred = list(set(job_preferred) - set(job_required))
     
     # Extract job experience requirement
-    job_exp_matches = re.search(r'(\d+)\+?\s*years?\s+.*?experience', job_text, re.IGNORECASE)
+    job_exp_matches = _JOB_EXP_RE.search(job_text)
     job_experience = float(job_exp_matches.group(1)) if job_exp_matches else 0
     
     job_data = {
@@ -543,62 +840,81 @@ def fallback_parsing(resume_text: str, job_text: str) -> tuple:
     
     return resume_data, job_data
 
+# Recommendation by score: bisect_right(RECOMMENDATION_THRESHOLDS, score) indexes RECOMMENDATIONS
+RECOMMENDATION_THRESHOLDS = (50, 70, 85)
+RECOMMENDATIONS = (
+    {
+        'level': 'Poor',
+        'text': 'Not recommended for this role',
+        'color': 'danger',
+        'icon': 'x-circle'
+    },
+    {
+        'level': 'Moderate',
+        'text': 'Consider if no better candidates',
+        'color': 'warning',
+        'icon': 'alert-circle'
+    },
+    {
+        'level': 'Good',
+        'text': 'Worth considering for interview',
+        'color': 'info',
+        'icon': 'thumbs-up'
+    },
+    {
+        'level': 'Excellent',
+        'text': 'Strong candidate, recommend immediate interview',
+        'color': 'success',
+        'icon': 'check-circle'
+    }
+)
+
 def get_recommendation(score: float) -> Dict:
     """Get recommendation based on match score"""
-    if score >= 85:
-        return {
-            'level': 'Excellent',
-            'text': 'Strong candidate, recommend immediate interview',
-            'color': 'success',
-            'icon': 'check-circle'
-        }
-    elif score >= 70:
-        return {
-            'level': 'Good',
-            'text': 'Worth considering for interview',
-            'color': 'info',
-            'icon': 'thumbs-up'
-        }
-    elif score >= 50:
-        return {
-            'level': 'Moderate',
-            'text': 'Consider if no better candidates',
-            'color': 'warning',
-            'icon': 'alert-circle'
-        }
-    else:
-        return {
-            'level': 'Poor',
-            'text': 'Not recommended for this role',
-            'color': 'danger',
-            'icon': 'x-circle'
-        }
+    return dict(RECOMMENDATIONS[bisect.bisect_right(RECOMMENDATION_THRESHOLDS, score)])
+
+# Match quality by score: bisect_right(MATCH_QUALITY_THRESHOLDS, score) indexes MATCH_QUALITY_LABELS
+MATCH_QUALITY_THRESHOLDS = (50, 60, 70, 80, 90)
+MATCH_QUALITY_LABELS = ("Poor", "Moderate", "Fair", "Good", "Very Good", "Excellent")
 
 def get_match_quality(score: float) -> str:
     """Get match quality description"""
-    if score >= 90:
-        return "Excellent"
-    elif score >= 80:
-        return "Very Good"
-    elif score >= 70:
-        return "Good"
-    elif score >= 60:
-        return "Fair"
-    elif score >= 50:
-        return "Moderate"
-    else:
-        return "Poor"
+    return MATCH_QUALITY_LABELS[bisect.bisect_right(MATCH_QUALITY_THRESHOLDS, score)]
+
+def get_match_qualities(scores: List[float]) -> List[str]:
+    """Match quality descriptions for many scores in one vectorized lookup"""
+    buckets = np.searchsorted(MATCH_QUALITY_THRESHOLDS, scores, side='right')
+    return [MATCH_QUALITY_LABELS[bucket] for bucket in buckets.tolist()]
+
+def json_response(data: Dict):
+    """Serialize a JSON response with orjson when available, else fall back to jsonify"""
+    if orjson is not None:
+        try:
+            return app.response_class(
+                orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY),
+                mimetype='application/json'
+            )
+        except TypeError:
+            # orjson rejects non-str keys, ints above 64 bits and unknown types
+            pass
+    return jsonify(data)
 
-def save_match_result(data: Dict, resume_filename: str):
-    """Save match result to file"""
+def save_match_result(data: Dict, resume_filename: str, saved_at: Optional[datetime] = None):
+    """Save match result to file, named by saved_at (default: now)"""
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_filename = re.sub(r'[^\w\-_]', '_', resume_filename)
+        timestamp = (saved_at or datetime.now()).strftime("%Y%m%d_%H%M%S")
+        safe_filename = _SAFE_FN_RE.sub('_', resume_filename)
         output_filename = f"match_result_{timestamp}_{safe_filename}.json"
         output_path = os.path.join(OUTPUT_DIR, output_filename)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, cls=NumpyEncoder)
+        # Match results are built from native Python types (scores are wrapped
+        # in float() by the matchers), so no NumPy-aware encoding is needed here
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(data))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
         
         print(f"💾 Result saved to: {output_path}")
         return output_path
@@ -610,8 +926,108 @@ def save_match_result(data: Dict, resume_filename: str):
 def get_output(filename):
     return send_from_directory(OUTPUT_DIR, filename)
 
+def match_resume_directory(resumes_dir: str, job_path: str,
+                           min_required_matches: int = 0) -> List[Dict]:
+    """
+    Score every supported resume in a directory against one job description.
+    
+    The job description is read and parsed once and the models are loaded
+    once for the whole batch. Returns results sorted best match first;
+    unreadable resumes ('error') and resumes below min_required_matches
+    ('skipped') are listed last.
+    """
+    resume_names = sorted(name for name in os.listdir(resumes_dir)
+                          if get_file_parser(name.lower()) is not None)
+    if not resume_names:
+        raise ValueError(f"No PDF, DOCX or TXT resumes found in {resumes_dir}")
+    if get_file_parser(job_path.lower()) is None:
+        raise ValueError(f"Unsupported job description format: {job_path}")
+    
+    payloads = []
+    for path in [os.path.join(resumes_dir, name) for name in resume_names] + [job_path]:
+        with open(path, 'rb') as f:
+            payloads.append((path.lower(), f.read()))
+    texts = extract_texts(payloads)
+    resume_texts, job_text = texts[:-1], texts[-1]
+    if not job_text or len(job_text.strip()) < 10:
+        raise ValueError(f"{job_path} is empty or could not be parsed")
+    
+    # Unreadable resumes are reported rather than failing the whole batch
+    results = []
+    readable = []
+    for name, text in zip(resume_names, resume_texts):
+        if text and len(text.strip()) >= 10:
+            readable.append((name, text))
+        else:
+            results.append({'resume_filename': name, 'error': 'empty or could not be parsed'})
+    
+    if readable:
+        scored = match_documents([text for _, text in readable], [job_text], min_required_matches)
+        qualities = get_match_qualities([match_result['overall_score'] for _, _, match_result in scored])
+        for (i, _, match_result), match_quality in zip(scored, qualities):
+            results.append({
+                'resume_filename': readable[i][0],
+                'match_score': match_result['overall_score'],
+                'match_quality': match_quality,
+                'match_result': match_result
+            })
+        
+        scored_resumes = {i for i, _, _ in scored}
+        for i, (name, _) in enumerate(readable):
+            if i not in scored_resumes:
+                results.append({'resume_filename': name,
+                                'skipped': f'fewer than {min_required_matches} required skills matched'})
+    
+    results.sort(key=lambda r: r.get('match_score', -1.0), reverse=True)
+    return results
+
+def run_batch_cli(args) -> int:
+    """Print a ranked table for --resumes-dir/--job and optionally save it as JSON"""
+    try:
+        results = match_resume_directory(args.resumes_dir, args.job, args.min_required_matches)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    
+    scored_count = sum('match_score' in result for result in results)
+    skipped_count = sum('skipped' in result for result in results)
+    print(f"📊 {scored_count} resumes scored against {os.path.basename(args.job)}")
+    print("=" * 60)
+    for rank, result in enumerate(results, 1):
+        if 'error' in result:
+            print(f"  -  {result['resume_filename']}: {result['error']}")
+        elif 'skipped' in result:
+            print(f"  -  {result['resume_filename']}: skipped, {result['skipped']}")
+        else:
+            print(f"{rank:3d}. {result['match_score']:6.2f}  {result['match_quality']:<10} {result['resume_filename']}")
+    if skipped_count:
+        print(f"⏭️ Skipped {skipped_count} resumes below the required-skill threshold "
+              f"({args.min_required_matches})")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, cls=NumpyEncoder, ensure_ascii=False)
+        print(f"💾 Results saved to: {args.output}")
+    return 0
+
 # ========== MAIN ==========
 if __name__ == '__main__':
+    import argparse
+    
+    cli = argparse.ArgumentParser(description="Smart Resume Matcher web server, or batch scoring "
+                                              "of a resume directory with --resumes-dir and --job")
+    cli.add_argument('--resumes-dir', help="directory of PDF/DOCX/TXT resumes to score")
+    cli.add_argument('--job', help="job description file (PDF/DOCX/TXT) for --resumes-dir")
+    cli.add_argument('--min-required-matches', type=int, default=0,
+                     help="skip jobs sharing fewer required skills with a resume")
+    cli.add_argument('--output', help="write batch results to this JSON file")
+    cli_args = cli.parse_args()
+    
+    if cli_args.resumes_dir or cli_args.job:
+        if not (cli_args.resumes_dir and cli_args.job):
+            cli.error("--resumes-dir and --job must be given together")
+        sys.exit(run_batch_cli(cli_args))
+    
     print("🚀 Starting Smart Resume Matcher Web Application...")
     print("=" * 60)
     print(f"📁 Output directory: {OUTPUT_DIR}")
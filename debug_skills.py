@@ -4,14 +4,17 @@ COMPREHENSIVE DEBUG SCRIPT FOR SMART RESUME-JOB MATCHER
 Project 4: AI-Powered Resume and Job Matching System
 """
 import sys
-import os
-import json
-import re
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
 import numpy as np
-from typing import Dict, List, Any, Tuple
+from typing import Dict
+
+PROJECT_DIR = Path(__file__).resolve().parent
 
 # Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.append(str(PROJECT_DIR / 'src'))
 
 # Import your components
 from document_parser import DocumentParser
@@ -28,15 +31,20 @@ class ProjectDebugger:
         self.test_data = {}
         self.debug_results = {}
         
-    def load_components(self):
-        """Load all project components"""
-        print("🚀 Loading project components...")
-        
+    def load_parser(self):
+        """Load the document parser (cheap; needed before the test files are read)"""
         try:
             self.components['parser'] = DocumentParser()
             print("  ✅ DocumentParser loaded")
         except Exception as e:
             print(f"  ❌ DocumentParser failed: {e}")
+    
+    def load_components(self):
+        """Load all project components"""
+        print("🚀 Loading project components...")
+        
+        if 'parser' not in self.components:
+            self.load_parser()
             
         try:
             self.components['matcher'] = ResumeJobMatcher()
@@ -45,7 +53,10 @@ class ProjectDebugger:
             print(f"  ❌ ResumeJobMatcher failed: {e}")
             
         try:
-            self.components['embedder'] = EmbeddingGenerator()
+            # Share the app's embedding cache so repeated runs skip inference
+            self.components['embedder'] = EmbeddingGenerator(
+                cache_dir=str(PROJECT_DIR / '.emb_cache'),
+                dtype=np.float16)
             print("  ✅ EmbeddingGenerator loaded")
         except Exception as e:
             print(f"  ❌ EmbeddingGenerator failed: {e}")
@@ -63,12 +74,19 @@ class ProjectDebugger:
         print(f"\n📂 Loading test files...")
         
         try:
-            with open(resume_path, 'r', encoding='utf-8', errors='ignore') as f:
-                self.test_data['resume_text'] = f.read()
-            print(f"  ✅ Resume loaded: {len(self.test_data['resume_text'])} chars")
+            # Both documents are independent reads, so extract them concurrently
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                resume_future = pool.submit(self._read_document, resume_path)
+                job_future = pool.submit(self._read_document, job_path)
+                self.test_data['resume_text'] = resume_future.result()
+                self.test_data['job_text'] = job_future.result()
+            
+            for name, key in (('Resume', 'resume_text'), ('Job description', 'job_text')):
+                if not self.test_data[key].strip():
+                    print(f"  ❌ {name} is empty or could not be extracted")
+                    return False
             
-            with open(job_path, 'r', encoding='utf-8', errors='ignore') as f:
-                self.test_data['job_text'] = f.read()
+            print(f"  ✅ Resume loaded: {len(self.test_data['resume_text'])} chars")
             print(f"  ✅ Job description loaded: {len(self.test_data['job_text'])} chars")
             
             return True
@@ -76,6 +94,16 @@ class ProjectDebugger:
             print(f"  ❌ Failed to load files: {e}")
             return False
     
+    def _read_document(self, path: str) -> str:
+        """Read a test document (PDF/DOCX via the parser, anything else as text)"""
+        path = Path(path)
+        ext = path.suffix[1:].lower()
+        parser = self.components.get('parser')
+        if parser is not None and ext in ('pdf', 'docx'):
+            return parser.extract_text(str(path), ext)
+        
+        return path.read_text(encoding='utf-8', errors='ignore')
+    
     def test_parsing(self):
         """Test document parsing"""
         print("\n" + "="*60)
@@ -137,12 +165,9 @@ class ProjectDebugger:
             resume_summary = resume_data['summary']
             job_summary = job_data.get('summary', self.test_data['job_text'][:1000])
             
-            print(f"  Generating resume embedding...")
-            resume_embedding = embedder.get_embedding(resume_summary)
+            print(f"  Generating resume and job embeddings...")
+            resume_embedding, job_embedding = embedder.get_embeddings_batch([resume_summary, job_summary])
             print(f"  Resume embedding shape: {resume_embedding.shape}")
-            
-            print(f"  Generating job embedding...")
-            job_embedding = embedder.get_embedding(job_summary)
             print(f"  Job embedding shape: {job_embedding.shape}")
             
             # Calculate semantic similarity
@@ -162,8 +187,8 @@ class ProjectDebugger:
             print(f"  Using fallback embeddings...")
             
             # Create dummy embeddings for testing
-            resume_embedding = np.random.randn(384).astype(np.float32)
-            job_embedding = np.random.randn(384).astype(np.float32)
+            resume_embedding = np.random.randn(384).astype(np.float16)
+            job_embedding = np.random.randn(384).astype(np.float16)
             semantic_score = 0.5
             
             return resume_embedding, job_embedding, semantic_score
@@ -180,34 +205,6 @@ class ProjectDebugger:
         
         print("\n🎯 RUNNING MATCHING ALGORITHM:")
         
-        # First, manually check skill matching
-        print("\n🔍 MANUAL SKILL MATCHING CHECK:")
-        
-        resume_skills = set(skill.lower().strip() for skill in resume_data['skills'])
-        required_skills = set(skill.lower().strip() for skill in job_data['required_skills'])
-        preferred_skills = set(skill.lower().strip() for skill in job_data['preferred_skills'])
-        
-        required_matches = resume_skills.intersection(required_skills)
-        preferred_matches = resume_skills.intersection(preferred_skills)
-        
-        print(f"  Resume skills count: {len(resume_skills)}")
-        print(f"  Required skills count: {len(required_skills)}")
-        print(f"  Preferred skills count: {len(preferred_skills)}")
-        print(f"  Required matches found: {len(required_matches)}")
-        print(f"  Preferred matches found: {len(preferred_matches)}")
-        
-        if required_matches:
-            print(f"  Matched required skills: {list(required_matches)}")
-        else:
-            print("  ⚠️  NO REQUIRED SKILLS MATCHED!")
-            
-        # Check each required skill individually
-        print("\n  Required skills matching breakdown:")
-        for skill in sorted(required_skills):
-            in_resume = skill in resume_skills
-            status = "✓" if in_resume else "✗"
-            print(f"    {status} {skill}")
-        
         # Run the actual matcher
         print("\n🤖 RUNNING RESUMEJOBMATCHER:")
         match_result = matcher.match(
@@ -227,14 +224,20 @@ class ProjectDebugger:
         print(f"  Education Score: {match_result['education_score']:.1f}%")
         print(f"  Semantic Score: {match_result['semantic_score']:.1f}%")
         
-        # Display skill details
+        # Display skill details straight from the matcher's own comparison
         skill_details = match_result['skill_details']
         print(f"\n🔧 SKILL DETAILS:")
+        print(f"  Resume skills count: {len(resume_data['skills'])}")
         print(f"  Required matches: {skill_details['required_coverage']}")
         print(f"  Preferred matches: {skill_details['preferred_coverage']}")
-        print(f"  Missing required: {len(skill_details['missing_required'])}")
-        if skill_details['missing_required']:
-            print(f"    - {skill_details['missing_required']}")
+        if not skill_details['required_matches']:
+            print("  ⚠️  NO REQUIRED SKILLS MATCHED!")
+        
+        print("\n  Required skills matching breakdown:")
+        for skill in sorted(skill_details['required_matches']):
+            print(f"    ✓ {skill}")
+        for skill in sorted(skill_details['missing_required']):
+            print(f"    ✗ {skill}")
         
         return match_result
     
@@ -322,7 +325,7 @@ class ProjectDebugger:
         # Save comprehensive report
         report = {
             'project': 'Smart Resume-Job Matcher',
-            'debug_timestamp': np.datetime64('now').astype(str),
+            'debug_timestamp': datetime.now().isoformat(timespec='seconds'),
             'components_loaded': list(self.components.keys()),
             'test_data_info': {
                 'resume_length': len(self.test_data.get('resume_text', '')),
@@ -347,17 +350,24 @@ class ProjectDebugger:
         print("✅ Debug report saved to: debug_report.json")
         
         # Also save a simplified version
+        summary_lines = [
+            "="*60,
+            "DEBUG SUMMARY - Smart Resume-Job Matcher",
+            "="*60,
+            "",
+            f"Overall Match Score: {report['matching_results']['overall_score']:.1f}%",
+            f"Skills Matched: {report['matching_results']['required_matches']}/{report['parsing_results']['job_required_count']}",
+            "",
+        ]
+        # Reuse the explainer's analysis instead of rebuilding it here
+        if self.debug_results.get('explanation'):
+            summary_lines.append(self.debug_results['explanation'])
+        else:
+            summary_lines.append("Missing Required Skills:")
+            summary_lines.extend(f"  - {skill}" for skill in report['matching_results']['missing_required'])
+        
         with open('debug_summary.txt', 'w', encoding='utf-8') as f:
-            f.write("="*60 + "\n")
-            f.write("DEBUG SUMMARY - Smart Resume-Job Matcher\n")
-            f.write("="*60 + "\n\n")
-            
-            f.write(f"Overall Match Score: {report['matching_results']['overall_score']:.1f}%\n")
-            f.write(f"Skills Matched: {report['matching_results']['required_matches']}/{report['parsing_results']['job_required_count']}\n\n")
-            
-            f.write("Missing Required Skills:\n")
-            for skill in report['matching_results']['missing_required']:
-                f.write(f"  - {skill}\n")
+            f.write("\n".join(summary_lines) + "\n")
         
         print("✅ Debug summary saved to: debug_summary.txt")
     
@@ -367,16 +377,19 @@ class ProjectDebugger:
         print("Project: AI-Powered Resume and Job Matching System")
         print("="*80)
         
+        # Read the test files first, so a bad path or an empty document fails
+        # before the matcher and embedding model are loaded
+        print("🚀 Loading document parser...")
+        self.load_parser()
+        if not self.load_test_files(resume_path, job_path):
+            print("❌ Failed to load test files. Exiting.")
+            return False
+        
         # Load components
         if not self.load_components():
             print("❌ Failed to load components. Exiting.")
             return False
         
-        # Load test files
-        if not self.load_test_files(resume_path, job_path):
-            print("❌ Failed to load test files. Exiting.")
-            return False
-        
         # Run all phases
         try:
             # Phase 1: Parsing
@@ -408,46 +421,42 @@ class ProjectDebugger:
             traceback.print_exc()
             return False
 
-def main():
-    """Main debug function"""
+def main(argv=None):
+    """Main debug function: debug_skills.py [resume_path [job_path]]"""
+    args = sys.argv[1:] if argv is None else argv
     debugger = ProjectDebugger()
     
     # Define test file paths
-    resume_path = 'data/sample_resume.txt'
-    job_path = 'data/sample_job.txt'
+    resume_path = Path(args[0]) if args else Path('data/sample_resume.txt')
+    job_path = Path(args[1]) if len(args) > 1 else Path('data/sample_job.txt')
     
     # Alternative paths if data folder doesn't exist
-    if not os.path.exists(resume_path):
+    if not args and not resume_path.is_file():
         print(f"⚠️  {resume_path} not found. Using alternative paths...")
         
         # Try to find files
         possible_paths = [
-            'sample_resume.txt',
-            'test_resume.txt',
-            'resume.txt',
-            '../data/sample_resume.txt'
+            Path('sample_resume.txt'),
+            Path('test_resume.txt'),
+            Path('resume.txt'),
+            Path('../data/sample_resume.txt')
         ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                resume_path = path
-                break
+        resume_path = next((path for path in possible_paths if path.is_file()), resume_path)
         
         # If still not found, create a sample
-        if not os.path.exists(resume_path):
+        if not resume_path.is_file():
             print("Creating sample resume...")
-            with open('sample_resume.txt', 'w') as f:
-                f.write("""
+            resume_path = Path('sample_resume.txt')
+            resume_path.write_text("""
 John Doe - Software Engineer
 Summary: Experienced Python developer with 5 years in web development.
 Skills: Python, Django, JavaScript, SQL, AWS, Docker, Git
 Experience: 5 years as Senior Developer at TechCorp
 Education: Bachelor of Science in Computer Science
                 """)
-            resume_path = 'sample_resume.txt'
     
     # Run debug
-    success = debugger.run_complete_debug(resume_path, job_path)
+    success = debugger.run_complete_debug(str(resume_path), str(job_path))
     
     if success:
         print("\n🎉 Debug completed! Check the following files:")
@@ -10,50 +10,9 @@ import subprocess
 import platform
 from pathlib import Path
 
-def check_python_version():
-    """Check if Python version is 3.8 or higher."""
-    required_version = (3, 8)
-    current_version = sys.version_info[:2]
-    
-    if current_version < required_version:
-        print(f"❌ Python {required_version[0]}.{required_version[1]} or higher is required.")
-        print(f"   Current version: {sys.version}")
-        return False
-    return True
-
-def install_dependencies():
-    """Install required Python packages."""
-    print("📦 Installing dependencies...")
-    
-    requirements_file = "requirements.txt"
-    if not os.path.exists(requirements_file):
-        print(f"❌ {requirements_file} not found!")
-        return False
-    
-    try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", requirements_file])
-        print("✅ Dependencies installed successfully!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install dependencies: {e}")
-        return False
-
-def create_directories():
-    """Create necessary directories."""
-    directories = ['uploads', 'results', 'data', 'src']
-    
-    print("📁 Creating directory structure...")
-    for dir_name in directories:
-        dir_path = Path(dir_name)
-        dir_path.mkdir(exist_ok=True)
-        print(f"   Created/verified: {dir_path}")
-
-def create_sample_files():
-    """Create sample files for testing."""
-    print("📄 Creating sample files...")
-    
-    # Create sample resume
-    sample_resume = """John Doe - Senior Software Engineer
+# Sample documents written by create_sample_files, kept as UTF-8 bytes so
+# nothing is re-encoded on each run
+SAMPLE_RESUME = b"""John Doe - Senior Software Engineer
 
 SUMMARY:
 Experienced software engineer with 5+ years in full-stack development.
@@ -87,9 +46,8 @@ CERTIFICATIONS:
 - AWS Certified Solutions Architect
 - Google Cloud Professional Developer
 """
-    
-    # Create sample job description
-    sample_job = """Senior Python Developer
+
+SAMPLE_JOB = b"""Senior Python Developer
 
 JOB DESCRIPTION:
 We are looking for a Senior Python Developer to join our team.
@@ -125,13 +83,52 @@ RESPONSIBILITIES:
 - Participate in code reviews
 - Troubleshoot and debug applications
 """
+
+def check_python_version():
+    """Check if Python version is 3.8 or higher."""
+    required_version = (3, 8)
+    current_version = sys.version_info[:2]
     
-    # Save sample files
-    with open('data/sample_resume.txt', 'w', encoding='utf-8') as f:
-        f.write(sample_resume)
+    if current_version < required_version:
+        print(f"❌ Python {required_version[0]}.{required_version[1]} or higher is required.")
+        print(f"   Current version: {sys.version}")
+        return False
+    return True
+
+def install_dependencies():
+    """Install required Python packages."""
+    print("📦 Installing dependencies...")
     
-    with open('data/sample_job.txt', 'w', encoding='utf-8') as f:
-        f.write(sample_job)
+    requirements_file = "requirements.txt"
+    if not os.path.exists(requirements_file):
+        print(f"❌ {requirements_file} not found!")
+        return False
+    
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", requirements_file])
+        print("✅ Dependencies installed successfully!")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to install dependencies: {e}")
+        return False
+
+def create_directories():
+    """Create necessary directories."""
+    directories = ['uploads', 'results', 'data', 'src']
+    
+    print("📁 Creating directory structure...")
+    for dir_name in directories:
+        dir_path = Path(dir_name)
+        dir_path.mkdir(exist_ok=True)
+        print(f"   Created/verified: {dir_path}")
+
+def create_sample_files():
+    """Create sample files for testing."""
+    print("📄 Creating sample files...")
+    
+    # Save sample files
+    Path('data/sample_resume.txt').write_bytes(SAMPLE_RESUME)
+    Path('data/sample_job.txt').write_bytes(SAMPLE_JOB)
     
     print("✅ Sample files created in 'data/' directory")
 
@@ -178,18 +175,18 @@ def main():
             # Try installing common packages individually
             packages = [
                 "numpy>=1.21.0",
-                "scikit-learn>=1.0.0",
                 "sentence-transformers>=2.2.0",
                 "PyPDF2>=2.0.0",
                 "python-docx>=0.8.11"
             ]
-            for package in packages:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+            # One pip run resolves all packages together instead of once per package
+            subprocess.check_call([sys.executable, "-m", "pip", "install",
+                                   "--prefer-binary", "--no-compile", *packages])
             print("✅ Core packages installed successfully!")
         except Exception as e:
             print(f"❌ Failed to install core packages: {e}")
             print("\nPlease install dependencies manually:")
-            print("  pip install numpy scikit-learn sentence-transformers PyPDF2 python-docx")
+            print("  pip install numpy sentence-transformers PyPDF2 python-docx")
     
     # Setup virtual environment (optional)
     setup_venv()
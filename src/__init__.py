@@ -6,12 +6,33 @@ Version: 1.0.0
 __version__ = "1.0.0"
 __author__ = "Professional Development Team"
 
-# Export main classes for easy importing
-from .document_parser import DocumentParser
-from .matcher import MatchingEngine, ResumeJobMatcher
-from .embedding_generator import EmbeddingGenerator
-from .ai_explainer import AIExplainer
-from .utils import save_results, load_results, convert_numpy_types
+import importlib
+
+# Export main classes for easy importing; submodules are imported on first
+# attribute access (PEP 562) so importing the package stays cheap
+_LAZY = {
+    'DocumentParser': '.document_parser',
+    'MatchingEngine': '.matcher',
+    'ResumeJobMatcher': '.matcher',
+    'EmbeddingGenerator': '.embedding_generator',
+    'AIExplainer': '.ai_explainer',
+    'save_results': '.utils',
+    'load_results': '.utils',
+    'convert_numpy_types': '.utils'
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
+
 
 __all__ = [
     'DocumentParser',
@@ -0,0 +1,151 @@
+"""
+Numeric kernels for batch scoring
+Compiled with numba when it is installed, plain Python/NumPy otherwise
+
+Kernels are not cached to disk: this module is imported both as `_kernels`
+and as `src._kernels`, and numba's cache records the importing module name.
+They are compiled lazily on first call, so importing this module costs no JIT
+time in processes that never call them.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(fastmath=True)
+def cos_sim(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Cosine similarity of two contiguous float32 vectors, in one pass.
+
+    Only used when simsimd is not installed; zero vectors score 0.
+    """
+    dot = 0.0
+    norm_a = 0.0
+    norm_b = 0.0
+    for i in range(a.shape[0]):
+        dot += a[i] * b[i]
+        norm_a += a[i] * a[i]
+        norm_b += b[i] * b[i]
+    if norm_a == 0.0 or norm_b == 0.0:
+        return 0.0
+    return dot / (math.sqrt(norm_a) * math.sqrt(norm_b))
+
+
+@njit
+def gallop_count(small: np.ndarray, big: np.ndarray) -> int:
+    """
+    Count ids of sorted `small` that occur in sorted `big`.
+
+    Gallops through `big` in doubling steps and binary-searches the bracketed
+    window, so a short list against a long one costs O(len(small) * log(len(big))).
+    """
+    count = 0
+    pos = 0
+    n_big = big.shape[0]
+    for k in range(small.shape[0]):
+        target = small[k]
+        step = 1
+        while pos + step < n_big and big[pos + step] < target:
+            step *= 2
+        end = min(pos + step + 1, n_big)
+        pos += np.searchsorted(big[pos:end], target)
+        if pos >= n_big:
+            break
+        if big[pos] == target:
+            count += 1
+            pos += 1
+    return count
+
+
+@njit
+def count_sorted_intersections(query: np.ndarray, ids: np.ndarray,
+                               offsets: np.ndarray) -> np.ndarray:
+    """
+    Count how many ids of a sorted query appear in each row of a CSR id list.
+
+    Rows are ids[offsets[k]:offsets[k + 1]], each sorted and duplicate-free.
+    Similar-sized lists are merged linearly; when one side is more than four
+    times longer, the short side gallops through it instead.
+    """
+    n_rows = offsets.shape[0] - 1
+    n_query = query.shape[0]
+    counts = np.zeros(n_rows, dtype=np.int32)
+    for row in range(n_rows):
+        i = 0
+        j = offsets[row]
+        end = offsets[row + 1]
+        if end - j > 4 * n_query:
+            counts[row] = gallop_count(query, ids[j:end])
+            continue
+        if n_query > 4 * (end - j):
+            counts[row] = gallop_count(ids[j:end], query)
+            continue
+        count = 0
+        while i < n_query and j < end:
+            if query[i] == ids[j]:
+                count += 1
+                i += 1
+                j += 1
+            elif query[i] < ids[j]:
+                i += 1
+            else:
+                j += 1
+        counts[row] = count
+    return counts
+
+
+@njit(fastmath=True)
+def skill_scores_from_counts(required_matches: np.ndarray, required_totals: np.ndarray,
+                             preferred_matches: np.ndarray, preferred_totals: np.ndarray) -> np.ndarray:
+    """
+    Skill scores (0-100) from per-job match counts and skill-list sizes.
+
+    Uses the same 70/30 required/preferred weighting as
+    MatchingEngine.calculate_skill_score.
+    """
+    n_jobs = required_matches.shape[0]
+    skill_scores = np.empty(n_jobs, dtype=np.float64)
+    for job in range(n_jobs):
+        required_total = required_totals[job]
+        preferred_total = preferred_totals[job]
+        required_coverage = required_matches[job] / required_total if required_total else 1.0
+        preferred_coverage = preferred_matches[job] / preferred_total if preferred_total else 1.0
+        if required_total:
+            skill_scores[job] = (required_coverage * 0.7 + preferred_coverage * 0.3) * 100
+        else:
+            skill_scores[job] = preferred_coverage * 100
+    return skill_scores
+
+
+def pack_skill_bits(ids: np.ndarray, offsets: np.ndarray, n_words: int) -> np.ndarray:
+    """Pack CSR skill-id rows into a (rows, n_words) uint64 bitset matrix"""
+    n_rows = offsets.shape[0] - 1
+    bits = np.zeros((n_rows, n_words), dtype=np.uint64)
+    rows = np.repeat(np.arange(n_rows), np.diff(offsets))
+    np.bitwise_or.at(bits, (rows, ids >> 6),
+                     np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64)))
+    return bits
+
+
+# Set bits per byte value, for NumPy releases without np.bitwise_count (< 2.0)
+_BYTE_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+
+def popcount_rows(words: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a uint64 bitset matrix"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    words = np.ascontiguousarray(words)
+    return _BYTE_POPCOUNT[words.view(np.uint8)].sum(axis=-1, dtype=np.int64)
@@ -1,108 +1,143 @@
 """
 AI Explanation Generator
 """
-from typing import Dict, List
+from bisect import bisect_right
+from string import Template
+from typing import Dict, List, Optional
 from datetime import datetime
 
+# Shared body of every explanation; the per-level header and next steps are
+# spliced in once when the templates are built
+_BODY = """$header
+
+**📊 SKILL ANALYSIS**
+- **Required Skills Matched ($matched_count/$required_count):**$matched_lines$missing_lines
+
+**⏳ EXPERIENCE ANALYSIS**
+$exp_line
+
+**💡 NEXT STEPS**
+$next_steps
+
+*Analysis generated on $timestamp*"""
+
+# Match level by overall score: bisect_right(_LEVEL_THRESHOLDS, score) indexes _LEVELS
+_LEVEL_THRESHOLDS = (70, 80, 90)
+_LEVELS = ('poor', 'fair', 'good', 'excellent')
+
+
+def _compile_templates(level_text: Dict[str, tuple]) -> Dict[str, Template]:
+    """Splice each level's header and next steps into the shared body"""
+    body = Template(_BODY)
+    return {
+        level: Template(body.safe_substitute(header="\n".join(header),
+                                             next_steps="\n".join(steps)))
+        for level, (header, steps) in level_text.items()
+    }
+
+
 class AIExplainer:
     """Generate human-readable explanations for matches"""
     
-    def __init__(self):
-        self.templates = self._load_templates()
-    
-    def _load_templates(self) -> Dict:
-        """Load explanation templates"""
-        return {
-            'excellent': [
+    # Per level: (header lines, next steps)
+    _LEVEL_TEXT = {
+        'excellent': (
+            (
                 "🎯 **EXCELLENT MATCH** - This candidate strongly aligns with all job requirements.",
                 "**Key Strengths:** Complete skill overlap, exceeds experience requirements.",
                 "**Recommendation:** Highly recommended for immediate interview consideration."
-            ],
-            'good': [
+            ),
+            (
+                "1. Schedule interview immediately",
+                "2. Discuss specific projects and achievements",
+                "3. Consider technical assessment for validation"
+            )
+        ),
+        'good': (
+            (
                 "✅ **STRONG MATCH** - Candidate meets most requirements with excellent core skills.",
                 "**Strengths:** Strong foundation in key required areas.",
                 "**Recommendation:** Strong candidate worth interviewing."
-            ],
-            'fair': [
+            ),
+            (
+                "1. Schedule screening interview",
+                "2. Verify missing preferred skills",
+                "3. Discuss career goals and growth potential"
+            )
+        ),
+        'fair': (
+            (
                 "⚠️ **GOOD MATCH** - Candidate has relevant experience with some skill gaps.",
                 "**Strengths:** Has most required skills and meets experience requirements.",
                 "**Gaps:** Missing some preferred skills.",
                 "**Recommendation:** Consider if other candidates are unavailable."
-            ],
-            'poor': [
+            ),
+            (
+                "1. Conduct phone screening first",
+                "2. Assess willingness to learn missing skills",
+                "3. Compare with other candidates"
+            )
+        ),
+        'poor': (
+            (
                 "❌ **POOR MATCH** - Significant gaps between candidate and job requirements.",
                 "**Issues:** Missing critical required skills or insufficient experience.",
                 "**Recommendation:** Not recommended for this role."
-            ]
-        }
+            ),
+            (
+                "1. Consider for different role",
+                "2. Keep in talent pool for future",
+                "3. Provide constructive feedback"
+            )
+        )
+    }
+    
+    # Compiled once at class creation and shared (read-only) by every instance
+    _TEMPLATES = _compile_templates(_LEVEL_TEXT)
+    
+    def __init__(self):
+        self.templates = self._load_templates()
+    
+    def _load_templates(self) -> Dict[str, Template]:
+        """Load explanation templates, one complete message per match level"""
+        return self._TEMPLATES
     
     def generate_match_explanation(self, resume_data: Dict, 
                                  job_data: Dict, 
-                                 match_result: Dict) -> str:
-        """Generate explanation for match"""
+                                 match_result: Dict,
+                                 generated_at: Optional[datetime] = None) -> str:
+        """Generate explanation for match, stamped with generated_at (default: now)"""
         
         overall_score = match_result['overall_score']
         
         # Determine match level
-        if overall_score >= 90:
-            match_level = 'excellent'
-        elif overall_score >= 80:
-            match_level = 'good'
-        elif overall_score >= 70:
-            match_level = 'fair'
-        else:
-            match_level = 'poor'
+        match_level = _LEVELS[bisect_right(_LEVEL_THRESHOLDS, overall_score)]
         
-        # Build explanation
-        explanation = []
-        explanation.extend(self.templates[match_level])
-        
-        # Add skill analysis
+        # Skill analysis blocks
         skill_details = match_result.get('skill_details', {})
         required_matches = skill_details.get('required_matches', [])
         missing_required = skill_details.get('missing_required', [])
         
-        explanation.append(f"\n**📊 SKILL ANALYSIS**")
-        explanation.append(f"- **Required Skills Matched ({len(required_matches)}/{len(job_data['required_skills'])}):**")
-        if required_matches:
-            for skill in required_matches[:5]:
-                explanation.append(f"  ✓ {skill}")
-        
+        matched_lines = "".join(f"\n  ✓ {skill}" for skill in required_matches[:5])
+        missing_lines = ""
         if missing_required:
-            explanation.append(f"- **Missing Required Skills ({len(missing_required)}):**")
-            for skill in missing_required[:3]:
-                explanation.append(f"  ✗ {skill}")
+            missing_lines = f"\n- **Missing Required Skills ({len(missing_required)}):**" + \
+                "".join(f"\n  ✗ {skill}" for skill in missing_required[:3])
         
-        # Add experience analysis
+        # Experience analysis
         exp_years = resume_data.get('experience_years', 0)
         exp_required = job_data.get('experience_required', 0)
         
-        explanation.append(f"\n**⏳ EXPERIENCE ANALYSIS**")
         if exp_years >= exp_required:
-            explanation.append(f"✓ Exceeds requirement: {exp_years} years (vs {exp_required} required)")
-        else:
-            explanation.append(f"⚠️  Below requirement: {exp_years} years (vs {exp_required} required)")
-        
-        # Add specific recommendations
-        explanation.append(f"\n**💡 NEXT STEPS**")
-        
-        if match_level == 'excellent':
-            explanation.append("1. Schedule interview immediately")
-            explanation.append("2. Discuss specific projects and achievements")
-            explanation.append("3. Consider technical assessment for validation")
-        elif match_level == 'good':
-            explanation.append("1. Schedule screening interview")
-            explanation.append("2. Verify missing preferred skills")
-            explanation.append("3. Discuss career goals and growth potential")
-        elif match_level == 'fair':
-            explanation.append("1. Conduct phone screening first")
-            explanation.append("2. Assess willingness to learn missing skills")
-            explanation.append("3. Compare with other candidates")
+            exp_line = f"✓ Exceeds requirement: {exp_years} years (vs {exp_required} required)"
         else:
-            explanation.append("1. Consider for different role")
-            explanation.append("2. Keep in talent pool for future")
-            explanation.append("3. Provide constructive feedback")
-        
-        explanation.append(f"\n*Analysis generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
+            exp_line = f"⚠️  Below requirement: {exp_years} years (vs {exp_required} required)"
         
-        return "\n".join(explanation)
\ No newline at end of file
+        return self.templates[match_level].substitute(
+            matched_count=len(required_matches),
+            required_count=len(job_data['required_skills']),
+            matched_lines=matched_lines,
+            missing_lines=missing_lines,
+            exp_line=exp_line,
+            timestamp=(generated_at or datetime.now()).strftime('%Y-%m-%d %H:%M')
+        )
@@ -1,13 +1,162 @@
+import hashlib
+import io
+import mmap
 import os
 import re
-import json
-from typing import Dict, List, Set
-import io
+import shutil
+import subprocess
+import sys
+import threading
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import ahocorasick  # Single-pass multi-keyword scanning (optional)
+except ImportError:
+    ahocorasick = None
+
+_WORD_RE = re.compile(r'\w+')
+
+# Experience-years patterns for resumes and job descriptions
+_RESUME_EXP_PATTERNS = [re.compile(p) for p in (
+    r'(\d+)\+?\s*years?\s+.*?experience',
+    r'experience.*?(\d+)\+?\s*years?',
+    r'(\d+)\+?\s*years?\s+.*?developer',
+    r'(\d+)\+?\s*years?\s+.*?engineer',
+    r'(\d+)\+?\s*years?\s+.*?professional',
+    r'(\d+)\+?\s*years?\s+.*?work'
+)]
+_JOB_EXP_PATTERNS = [re.compile(p) for p in (
+    r'(\d+)\+?\s*years?\s+.*?experience',
+    r'experience.*?(\d+)\+?\s*years?',
+    r'minimum.*?(\d+)\s*years?',
+    r'(\d+)\+?\s*years?\s+.*?required',
+    r'(\d+)\+?\s*years?\s+.*?minimum'
+)]
+
+# Job-description section headers (matched anywhere in a line, like `in`)
+_REQUIRED_HEADER_RE = re.compile(r'required:|requirements:|must have:|required skills:|qualifications:')
+_PREFERRED_HEADER_RE = re.compile(r'preferred:|nice to have:|bonus:|preferred skills:|pluses:')
+
+# Context words that mark a job-description skill as required or preferred
+# (lookaheads, so finditer reports overlapping occurrences too)
+_REQUIRED_CONTEXT_RE = re.compile(r'(?=(required|must|need|essential|requirement))')
+_PREFERRED_CONTEXT_RE = re.compile(r'(?=(preferred|nice|bonus|plus|desired))')
+
+# Date ranges like "2018 - 2022" or "2019 - present"
+_YEAR_RANGE_RE = re.compile(r'(\d{4})\s*[-–]\s*(\d{4}|present|current|now)')
+
+_EDU_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(bachelor|b\.?s\.?|b\.?a\.?|b\.?tech|b\.?e\.?|b\.?com)\s+.*?\s+(in|of)?\s*([a-z\s&]+)',
+    r'(master|m\.?s\.?|m\.?a\.?|m\.?tech|m\.?e\.?|mba)\s+.*?\s+(in|of)?\s*([a-z\s&]+)',
+    r'(ph\.?d|doctorate|phd)\s+.*?\s+(in|of)?\s*([a-z\s&]+)',
+    r'(associate|diploma|certificate)\s+.*?\s+(in|of)?\s*([a-z\s&]+)'
+)]
+
+# Poppler's pdftotext, if installed, is the fastest PDF extractor available
+_PDFTOTEXT = shutil.which('pdftotext')
+
+# Text files at least this large are memory-mapped instead of read into a buffer
+_MMAP_MIN_BYTES = 1 << 20
+
+# Parsed documents remembered per parser, keyed by a hash of the text
+_PARSE_CACHE_SIZE = 1024
+
+
+def _is_buffer(source) -> bool:
+    """Whether extract_text got file contents (bytes, memoryview, mmap) rather than a path"""
+    return not isinstance(source, (str, os.PathLike))
+
+
+def _import_pymupdf():
+    """PyMuPDF module (new `pymupdf` or legacy `fitz` name), or None if not installed"""
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            import fitz as pymupdf
+        except ImportError:
+            return None
+    return pymupdf
+
+
+def _import_pypdfium2():
+    """pypdfium2 module (Chromium's PDFium), or None if not installed"""
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+    return pypdfium2
+
+
+def _bounded(text: str, start: int, end: int, last: int) -> bool:
+    """
+    Whether text[start:end + 1] has no word character on either side.
+    
+    str.isalnum() plus '_' is exactly re's Unicode \\w, without a regex call.
+    """
+    if start:
+        before = text[start - 1]
+        if before.isalnum() or before == '_':
+            return False
+    if end != last:
+        after = text[end + 1]
+        if after.isalnum() or after == '_':
+            return False
+    return True
+
+
+def _fold(text: str) -> str:
+    """NFKC-normalized, casefolded text that every pattern and skill scan runs on"""
+    if not unicodedata.is_normalized('NFKC', text):
+        text = unicodedata.normalize('NFKC', text)
+    return text.casefold()
+
+
+# Parser each parse_many worker process received at start-up
+_worker_parser = None
+
+
+def _init_parse_worker(parser: 'DocumentParser'):
+    """ProcessPoolExecutor initializer: keep the parser for this worker's tasks"""
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _parse_resume_file(path_ext: Tuple[str, str]) -> Dict:
+    """parse_many task: extract and parse one resume file in a worker process"""
+    file_path, ext = path_ext
+    return _worker_parser.parse_resume(_worker_parser.extract_text(file_path, ext))
+
 
 class DocumentParser:
     def __init__(self):
+        self._parse_cache: 'OrderedDict[Tuple[str, bytes], Dict]' = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
         self.skill_keywords = self._load_skill_keywords()
-        
+        self.catalog_skills = self._flatten_skill_keywords(self.skill_keywords)
+        self.resume_skill_terms = self._load_resume_skill_terms()
+        self.skill_automaton = self._build_skill_automaton(self.resume_skill_terms)
+        self.resume_skill_regex = self._compile_skill_regex(self.resume_skill_terms)
+        self.job_skill_terms = self._load_job_skill_terms()
+        self.job_skill_automaton = self._build_skill_automaton(self.job_skill_terms)
+        self.job_skill_regex = self._compile_skill_regex(self.job_skill_terms)
+        
+    def __getstate__(self) -> Dict:
+        # Worker processes get the compiled tables, not the lock or parse cache
+        state = self.__dict__.copy()
+        del state['_parse_cache'], state['_parse_cache_lock']
+        return state
+    
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self._parse_cache = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+    
     def _load_skill_keywords(self) -> Dict[str, List[str]]:
         """Load common skills database - ONLY definitions"""
         return {
@@ -22,8 +171,16 @@ class DocumentParser:
             'soft_skills': ['leadership', 'communication', 'teamwork', 'problem-solving', 'analytical', 'critical thinking', 'time management']
         }
     
-    def extract_text(self, file_path: str, ext: str) -> str:
-        """Extract text from a file based on its extension"""
+    @staticmethod
+    def _flatten_skill_keywords(skill_keywords: Dict[str, List[str]]) -> Tuple[str, ...]:
+        """Every catalog skill once, in catalog order"""
+        return tuple(dict.fromkeys(chain.from_iterable(skill_keywords.values())))
+    
+    def extract_text(self, file_path: Union[str, bytes, mmap.mmap], ext: str) -> str:
+        """
+        Extract text from a file based on its extension. file_path may also be
+        the file's contents as a bytes-like object, e.g. a read-only mmap
+        """
         ext = ext.lower()
         
         try:
@@ -31,47 +188,98 @@ class DocumentParser:
                 return self._extract_from_pdf(file_path)
             elif ext == 'docx':
                 return self._extract_from_docx(file_path)
-            elif ext in ['txt', 'pdf.txt']:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    return f.read()
             else:
-                # Try to read as text file
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    return f.read()
+                # txt, or anything else we try to read as a text file
+                return self._extract_from_text(file_path)
         except Exception as e:
-            print(f"Error extracting text from {file_path}: {e}")
+            source = f"{ext} buffer" if _is_buffer(file_path) else file_path
+            print(f"Error extracting text from {source}: {e}")
             return ""
     
+    def _extract_from_text(self, file_path: str) -> str:
+        """Decode UTF-8 text from a file (large files straight from a memory map) or buffer"""
+        if _is_buffer(file_path):
+            text = str(file_path, 'utf-8', 'ignore')
+        else:
+            text = self._read_text_file(file_path)
+        # Same newline handling as a text-mode read
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
+    @staticmethod
+    def _read_text_file(file_path: str) -> str:
+        """Decoded contents of a text file (memory-mapped when large)"""
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < _MMAP_MIN_BYTES:
+                text = file.read().decode('utf-8', errors='ignore')
+            else:
+                # str() decodes from the mapped pages, so no full-size bytes copy is made
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    text = str(mapped, 'utf-8', 'ignore')
+        return text
+    
     def _extract_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF files"""
+        """Extract text from PDF files (pdftotext, then PyMuPDF, then pypdfium2, then PyPDF2)"""
+        # Contents already in memory skip pdftotext, which reads from a path
+        in_memory = _is_buffer(file_path)
+        if _PDFTOTEXT is not None and not in_memory:
+            try:
+                result = subprocess.run([_PDFTOTEXT, '-enc', 'UTF-8', file_path, '-'],
+                                        capture_output=True, check=True, timeout=30)
+                return result.stdout.decode('utf-8', errors='ignore')
+            except (subprocess.SubprocessError, OSError) as e:
+                print(f"pdftotext extraction error, retrying with Python parsers: {e}")
+        
+        pymupdf = _import_pymupdf()
+        if pymupdf is not None:
+            try:
+                # PyMuPDF reads a memoryview in place, without copying the contents
+                with (pymupdf.open(stream=memoryview(file_path), filetype='pdf') if in_memory
+                      else pymupdf.open(file_path)) as doc:
+                    return "\n".join(page.get_text("text") for page in doc)
+            except Exception as e:
+                print(f"PyMuPDF extraction error, retrying with other parsers: {e}")
+        
+        pdfium = _import_pypdfium2()
+        if pdfium is not None:
+            try:
+                return self._extract_with_pdfium(pdfium, bytes(file_path) if in_memory else file_path)
+            except Exception as e:
+                print(f"pypdfium2 extraction error, retrying with PyPDF2: {e}")
+        
         try:
             import PyPDF2
-            text = ""
-            with open(file_path, 'rb') as file:
+            with (io.BytesIO(file_path) if in_memory else open(file_path, 'rb')) as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            return text
+                return "\n".join((page.extract_text() or "") for page in pdf_reader.pages)
         except ImportError:
-            # Fallback if PyPDF2 not installed
-            try:
-                import fitz  # PyMuPDF
-                doc = fitz.open(file_path)
-                text = ""
-                for page in doc:
-                    text += page.get_text() + "\n"
-                return text
-            except:
-                return ""
+            return ""
         except Exception as e:
             print(f"PDF extraction error: {e}")
             return ""
     
+    @staticmethod
+    def _extract_with_pdfium(pdfium, file_path: str) -> str:
+        """Text of every page via PDFium, each page closed as soon as it is read"""
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            parts = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                # PDFium ends lines with CRLF
+                parts.append(textpage.get_text_bounded().replace('\r\n', '\n'))
+                textpage.close()
+                page.close()
+            return "\n".join(parts)
+        finally:
+            pdf.close()
+    
     def _extract_from_docx(self, file_path: str) -> str:
         """Extract text from DOCX files"""
         try:
             import docx
-            doc = docx.Document(file_path)
+            doc = docx.Document(io.BytesIO(file_path) if _is_buffer(file_path) else file_path)
             return "\n".join([paragraph.text for paragraph in doc.paragraphs])
         except ImportError:
             return ""
@@ -79,20 +287,12 @@ class DocumentParser:
             print(f"DOCX extraction error: {e}")
             return ""
     
-    def _find_skills_in_text(self, text: str) -> Set[str]:
-        """Find skills in text dynamically"""
-        text_lower = text.lower()
-        found_skills = set()
-        
-        # Get all possible skills
-        all_skills = []
-        for category, skills in self.skill_keywords.items():
-            all_skills.extend(skills)
-        
-        # Add compound skills
+    def _load_resume_skill_terms(self) -> Dict[str, Tuple[str, ...]]:
+        """Map every searchable skill term to the canonical skills it reports"""
+        # Catalog skills plus compound skills
         compound_skills = ['rest api', 'microservices', 'ci/cd', 'machine learning', 'deep learning', 
                           'artificial intelligence', 'data mining', 'cloud computing', 'version control']
-        all_skills.extend(compound_skills)
+        all_skills = dict.fromkeys(chain(self.catalog_skills, compound_skills))
         
         # Skill variations mapping
         skill_variations = {
@@ -123,22 +323,241 @@ class DocumentParser:
             'k8s': 'kubernetes'
         }
         
-        # Check for each skill
+        # A term can be both a skill and a variation (e.g. mysql -> mysql, sql)
+        terms: Dict[str, Set[str]] = {}
         for skill in all_skills:
-            pattern = r'(^|\W)' + re.escape(skill) + r'($|\W)'
-            if re.search(pattern, text_lower):
-                found_skills.add(skill)
-        
-        # Check for skill variations
+            terms.setdefault(skill, set()).add(skill)
         for variation, canonical in skill_variations.items():
-            pattern = r'(^|\W)' + re.escape(variation) + r'($|\W)'
-            if re.search(pattern, text_lower):
-                found_skills.add(canonical)
+            terms.setdefault(variation, set()).add(canonical)
         
+        return {term: tuple(sorted(canonicals)) for term, canonicals in terms.items()}
+    
+    def _load_job_skill_terms(self) -> Dict[str, Tuple[str, ...]]:
+        """Map every skill term searched in job descriptions to its canonical skill"""
+        # Catalog skills plus compound skills
+        all_skills = dict.fromkeys(chain(self.catalog_skills,
+                                         ['rest api', 'microservices', 'ci/cd', 'machine learning']))
+        
+        # Skill variations mapping
+        skill_cleanup = {
+            'ci/cd': 'ci/cd',
+            'cicd': 'ci/cd',
+            'rest api': 'rest api',
+            'restful api': 'rest api',
+            'mysql': 'sql',
+            'postgresql': 'sql',
+            'postgres': 'sql',
+            'javascript': 'javascript',
+            'js': 'javascript',
+            'react.js': 'react',
+            'aws': 'aws',
+            'amazon web services': 'aws',
+            'azure': 'azure',
+            'microsoft azure': 'azure',
+            'gcp': 'gcp',
+            'google cloud platform': 'gcp',
+            'kubernetes': 'kubernetes',
+            'k8s': 'kubernetes'
+        }
+        
+        # Only catalog skills are searched; the mapping just canonicalizes them
+        return {skill: (skill_cleanup.get(skill, skill),) for skill in all_skills}
+    
+    @staticmethod
+    def _build_skill_automaton(terms: Dict[str, Tuple[str, ...]]):
+        """Aho-Corasick automaton over all skill terms, or None without pyahocorasick"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for term, canonicals in terms.items():
+            automaton.add_word(term, (term, canonicals))
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _compile_skill_regex(terms: Dict[str, Tuple[str, ...]]):
+        """
+        Regex/set fallback used when pyahocorasick is not installed.
+        
+        Returns (words, union, implied, leads). `words` holds the single-word
+        terms: a word-bounded occurrence of one is exactly a \\w+ token, so they
+        are found by set intersection. `union` matches, at every word-bounded
+        position, the longest remaining (multi-word or punctuated) term
+        starting there; `implied` maps each of those to the shorter terms it
+        contains (e.g. 'react native' -> 'react'), which a one-match-per-position
+        scan would otherwise miss. `leads` holds the first token of every
+        compound term: when the text has none of them, `union` is skipped.
+        """
+        if ahocorasick is not None:
+            return None
+        
+        words = frozenset(term for term in terms if _WORD_RE.fullmatch(term))
+        compound = sorted((term for term in terms if term not in words), key=len, reverse=True)
+        union = None
+        if compound:
+            union = re.compile(r'(?<!\w)(?=(' + '|'.join(map(re.escape, compound)) + r')(?!\w))')
+        bounded = {term: re.compile(r'(?<!\w)' + re.escape(term) + r'(?!\w)') for term in terms}
+        implied = {}
+        for term in compound:
+            contained = []
+            for other, pattern in bounded.items():
+                if other != term:
+                    found = pattern.search(term)
+                    if found:
+                        contained.append((other, found.start()))
+            implied[term] = tuple(contained)
+        
+        # A compound term starts with its leading \w+ run as a whole token;
+        # one starting with punctuation would disable the pre-check
+        leads = set()
+        for term in compound:
+            lead = _WORD_RE.match(term)
+            if lead is None:
+                leads = None
+                break
+            leads.add(lead.group())
+        return words, union, implied, frozenset(leads) if leads is not None else None
+    
+    @staticmethod
+    def _match_skill_terms(text_lower: str, skill_regex, automaton) -> Set[str]:
+        """Terms that occur in lowercased text bounded by non-word characters"""
+        if automaton is not None:
+            matched = set()
+            # One pass over the text; keep hits bounded by non-word characters
+            last = len(text_lower) - 1
+            for end, (term, canonicals) in automaton.iter(text_lower):
+                start = end - len(term) + 1
+                if _bounded(text_lower, start, end, last):
+                    matched.add(term)
+            return matched
+        
+        # Single-word terms by token-set intersection, the rest in one regex pass
+        words, union, implied, leads = skill_regex
+        tokens = set(_WORD_RE.findall(text_lower))
+        matched = tokens & words
+        if union is not None and (leads is None or not leads.isdisjoint(tokens)):
+            for match in union.finditer(text_lower):
+                term = match.group(1)
+                if term not in matched:
+                    matched.add(term)
+                    matched.update(other for other, _ in implied[term])
+        
+        return matched
+    
+    @staticmethod
+    def _skill_term_hits(text_lower: str, skill_regex, automaton) -> List[Tuple[int, str]]:
+        """Every word-bounded (offset, term) occurrence in lowercased text, by offset"""
+        hits = []
+        if automaton is not None:
+            last = len(text_lower) - 1
+            for end, (term, canonicals) in automaton.iter(text_lower):
+                start = end - len(term) + 1
+                if _bounded(text_lower, start, end, last):
+                    hits.append((start, term))
+        else:
+            words, union, implied, leads = skill_regex
+            tokens = set()
+            for match in _WORD_RE.finditer(text_lower):
+                token = match.group()
+                tokens.add(token)
+                if token in words:
+                    hits.append((match.start(), token))
+            if union is not None and (leads is None or not leads.isdisjoint(tokens)):
+                for match in union.finditer(text_lower):
+                    term = match.group(1)
+                    start = match.start()
+                    hits.append((start, term))
+                    hits.extend((start + offset, other) for other, offset in implied[term])
+        
+        hits.sort()
+        return hits
+    
+    def _find_skills_in_text(self, text: str, text_lower: str = None) -> Set[str]:
+        """Find skills in text dynamically; pass text_lower if already folded"""
+        if text_lower is None:
+            text_lower = _fold(text)
+        found_skills = set()
+        for term in self._match_skill_terms(text_lower, self.resume_skill_regex,
+                                            self.skill_automaton):
+            found_skills.update(self.resume_skill_terms[term])
         return found_skills
     
+    @staticmethod
+    def _cue_spans(pattern: re.Pattern, text_lower: str) -> Tuple[List[int], List[int]]:
+        """Start and end offsets of every context cue in the text, sorted by start"""
+        starts = []
+        ends = []
+        for match in pattern.finditer(text_lower):
+            starts.append(match.start())
+            ends.append(match.end(1))
+        return starts, ends
+    
+    @staticmethod
+    def _has_cue(cues: Tuple[List[int], List[int]], start: int, end: int) -> bool:
+        """Whether a whole cue lies within text_lower[start:end]"""
+        starts, ends = cues
+        for i in range(bisect_left(starts, start), len(starts)):
+            if starts[i] >= end:
+                break
+            if ends[i] <= end:
+                return True
+        return False
+    
+    @staticmethod
+    def _canonical_skills(skills: Set[str]) -> List[str]:
+        """Sorted, lowercased skills interned once so matching compares by identity"""
+        return sorted({sys.intern(skill.lower().strip()) for skill in skills})
+    
+    def _cached_parse(self, kind: str, text: str, parse: Callable[[str], Dict]) -> Dict:
+        """
+        Run parse(text) through a small LRU cache keyed by a BLAKE2b digest.
+        
+        Parsing is a pure function of the text, so repeated documents skip all
+        regex/automaton work. Callers get a copy whose lists they may modify.
+        """
+        key = (kind, hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest())
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(key)
+            if cached is not None:
+                self._parse_cache.move_to_end(key)
+        if cached is None:
+            cached = parse(text)
+            with self._parse_cache_lock:
+                self._parse_cache[key] = cached
+                while len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                    self._parse_cache.popitem(last=False)
+        return {field: (value.copy() if isinstance(value, list) else value)
+                for field, value in cached.items()}
+    
     def parse_resume(self, text: str) -> Dict:
         """Parse resume text dynamically - NO HARDCODED DATA"""
+        return self._cached_parse('resume', text, self._parse_resume)
+    
+    def parse_job_description(self, text: str) -> Dict:
+        """Parse job description dynamically - NO HARDCODED DATA"""
+        return self._cached_parse('job', text, self._parse_job_description)
+    
+    def parse_many(self, paths_exts: List[Tuple[str, str]],
+                   workers: Optional[int] = None) -> List[Dict]:
+        """
+        Extract and parse many resume files across worker processes.
+        
+        Takes (file_path, ext) pairs and returns parse_resume results in the
+        same order. Each worker receives this parser once at start-up, and
+        files are sent in chunks of up to 8 to amortize round-trips.
+        """
+        if len(paths_exts) < 2:
+            return [self.parse_resume(self.extract_text(path, ext)) for path, ext in paths_exts]
+        
+        workers = min(len(paths_exts), workers or os.cpu_count() or 1)
+        chunksize = max(1, min(8, len(paths_exts) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker,
+                                 initargs=(self,)) as pool:
+            return list(pool.map(_parse_resume_file, paths_exts, chunksize=chunksize))
+    
+    def _parse_resume(self, text: str) -> Dict:
+        """Uncached parse_resume"""
         resume_data = {
             'skills': [],
             'experience': [],
@@ -147,25 +566,18 @@ class DocumentParser:
             'summary': text[:500] + ("..." if len(text) > 500 else "")
         }
         
+        text_lower = _fold(text)
+        
         # Find skills dynamically
-        skills_found = self._find_skills_in_text(text)
-        resume_data['skills'] = sorted(list(skills_found))
+        skills_found = self._find_skills_in_text(text, text_lower)
+        resume_data['skills'] = self._canonical_skills(skills_found)
         
         # Extract experience years
         experience_years = 0
         
         # Look for experience patterns
-        exp_patterns = [
-            r'(\d+)\+?\s*years?\s+.*?experience',
-            r'experience.*?(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s+.*?developer',
-            r'(\d+)\+?\s*years?\s+.*?engineer',
-            r'(\d+)\+?\s*years?\s+.*?professional',
-            r'(\d+)\+?\s*years?\s+.*?work'
-        ]
-        
-        for pattern in exp_patterns:
-            matches = re.findall(pattern, text.lower())
+        for pattern in _RESUME_EXP_PATTERNS:
+            matches = pattern.findall(text_lower)
             for match in matches:
                 if isinstance(match, tuple):
                     match = match[0]
@@ -177,7 +589,7 @@ class DocumentParser:
         # If no pattern found, look for year ranges
         if experience_years == 0:
             # Look for date ranges like "2018 - 2022"
-            year_ranges = re.findall(r'(\d{4})\s*[-–]\s*(\d{4}|present|current|now)', text)
+            year_ranges = _YEAR_RANGE_RE.findall(text)
             if year_ranges:
                 years_list = []
                 for start, end in year_ranges:
@@ -189,7 +601,7 @@ class DocumentParser:
                             end_year = 2025  # Current year
                         
                         years_list.append(end_year - start_year)
-                    except:
+                    except ValueError:
                         pass
                 
                 if years_list:
@@ -199,15 +611,8 @@ class DocumentParser:
         
         # Extract education
         education = []
-        edu_patterns = [
-            r'(bachelor|b\.?s\.?|b\.?a\.?|b\.?tech|b\.?e\.?|b\.?com)\s+.*?\s+(in|of)?\s*([a-z\s&]+)',
-            r'(master|m\.?s\.?|m\.?a\.?|m\.?tech|m\.?e\.?|mba)\s+.*?\s+(in|of)?\s*([a-z\s&]+)',
-            r'(ph\.?d|doctorate|phd)\s+.*?\s+(in|of)?\s*([a-z\s&]+)',
-            r'(associate|diploma|certificate)\s+.*?\s+(in|of)?\s*([a-z\s&]+)'
-        ]
-        
-        for pattern in edu_patterns:
-            matches = re.finditer(pattern, text.lower(), re.IGNORECASE)
+        for pattern in _EDU_PATTERNS:
+            matches = pattern.finditer(text_lower)
             for match in matches:
                 if len(match.groups()) >= 3:
                     edu = match.group(3).strip()
@@ -218,8 +623,8 @@ class DocumentParser:
         
         return resume_data
     
-    def parse_job_description(self, text: str) -> Dict:
-        """Parse job description dynamically - NO HARDCODED DATA"""
+    def _parse_job_description(self, text: str) -> Dict:
+        """Uncached parse_job_description"""
         jd_data = {
             'required_skills': [],
             'preferred_skills': [],
@@ -227,20 +632,12 @@ class DocumentParser:
             'education_required': []
         }
         
-        text_lower = text.lower()
+        text_lower = _fold(text)
         
         # Extract experience requirement
         experience_required = 0
-        exp_patterns = [
-            r'(\d+)\+?\s*years?\s+.*?experience',
-            r'experience.*?(\d+)\+?\s*years?',
-            r'minimum.*?(\d+)\s*years?',
-            r'(\d+)\+?\s*years?\s+.*?required',
-            r'(\d+)\+?\s*years?\s+.*?minimum'
-        ]
-        
-        for pattern in exp_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in _JOB_EXP_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 exp = match.group(1)
                 if exp.isdigit():
@@ -250,92 +647,66 @@ class DocumentParser:
         jd_data['experience_required'] = experience_required
         
         # Dynamic skill extraction
-        required_skills = set()
-        preferred_skills = set()
+        terms = self.job_skill_terms
         
-        # Get all skills
-        all_skills = []
-        for category, skills in self.skill_keywords.items():
-            all_skills.extend(skills)
-        
-        # Add compound skills
-        all_skills.extend(['rest api', 'microservices', 'ci/cd', 'machine learning'])
-        
-        # Skill variations mapping
-        skill_cleanup = {
-            'ci/cd': 'ci/cd',
-            'cicd': 'ci/cd',
-            'rest api': 'rest api',
-            'restful api': 'rest api',
-            'mysql': 'sql',
-            'postgresql': 'sql',
-            'postgres': 'sql',
-            'javascript': 'javascript',
-            'js': 'javascript',
-            'react.js': 'react',
-            'aws': 'aws',
-            'amazon web services': 'aws',
-            'azure': 'azure',
-            'microsoft azure': 'azure',
-            'gcp': 'gcp',
-            'google cloud platform': 'gcp',
-            'kubernetes': 'kubernetes',
-            'k8s': 'kubernetes'
-        }
-        
-        # Split into lines for section detection
-        lines = text.split('\n')
+        # Label every line with the section it belongs to
+        line_starts = []
+        line_sections = []
+        offset = 0
         current_section = None
         
-        for line in lines:
-            line_lower = line.lower().strip()
+        for line in text_lower.split('\n'):
+            line_starts.append(offset)
+            offset += len(line) + 1
+            line_lower = line.strip()
             
-            # Detect section type
-            if any(keyword in line_lower for keyword in ['required:', 'requirements:', 'must have:', 'required skills:', 'qualifications:']):
+            # Detect section type; a blank line ends the section
+            if not line_lower:
+                current_section = None
+            elif _REQUIRED_HEADER_RE.search(line_lower):
                 current_section = 'required'
-            elif any(keyword in line_lower for keyword in ['preferred:', 'nice to have:', 'bonus:', 'preferred skills:', 'pluses:']):
+            elif _PREFERRED_HEADER_RE.search(line_lower):
                 current_section = 'preferred'
-            elif line_lower in ['', '---', '___']:
+            elif line_lower in ('---', '___'):
                 current_section = None
+            line_sections.append(current_section)
+        
+        # One walk over every skill hit. A skill is required if any hit sits in a
+        # required section or the context around a term's first hit calls for it
+        # (the default); otherwise it is preferred. Cue offsets are found once and
+        # each context window is checked by bisection.
+        required_cues = self._cue_spans(_REQUIRED_CONTEXT_RE, text_lower)
+        preferred_cues = self._cue_spans(_PREFERRED_CONTEXT_RE, text_lower)
+        labels: Dict[str, str] = {}
+        seen_terms = set()
+        
+        for skill_pos, skill in self._skill_term_hits(text_lower, self.job_skill_regex,
+                                                      self.job_skill_automaton):
+            canonical_skill = terms[skill][0]
+            section = line_sections[bisect_right(line_starts, skill_pos) - 1]
             
-            # Extract skills from current section
-            if current_section:
-                for skill in all_skills:
-                    pattern = r'(^|\W)' + re.escape(skill) + r'($|\W)'
-                    if re.search(pattern, line_lower):
-                        canonical_skill = skill_cleanup.get(skill, skill)
-                        if current_section == 'required':
-                            required_skills.add(canonical_skill)
-                        elif current_section == 'preferred':
-                            preferred_skills.add(canonical_skill)
-        
-        # Also search entire text for skills with context
-        for skill in all_skills:
-            pattern = r'(^|\W)' + re.escape(skill) + r'($|\W)'
-            if re.search(pattern, text_lower):
-                canonical_skill = skill_cleanup.get(skill, skill)
-                
-                # Check context around the skill
-                skill_pos = text_lower.find(skill)
-                if skill_pos != -1:
-                    # Get context around the skill
-                    start = max(0, skill_pos - 50)
-                    end = min(len(text_lower), skill_pos + len(skill) + 50)
-                    context = text_lower[start:end]
-                    
-                    # Determine if required or preferred based on context
-                    if any(word in context for word in ['required', 'must', 'need', 'essential', 'requirement']):
-                        required_skills.add(canonical_skill)
-                    elif any(word in context for word in ['preferred', 'nice', 'bonus', 'plus', 'desired']):
-                        preferred_skills.add(canonical_skill)
-                    else:
-                        # Default to required if no context
-                        required_skills.add(canonical_skill)
-        
-        # Remove any preferred skills that are also in required
-        preferred_skills = preferred_skills - required_skills
-        
-        jd_data['required_skills'] = sorted(list(required_skills))
-        jd_data['preferred_skills'] = sorted(list(preferred_skills))
+            context = None
+            if skill not in seen_terms:
+                seen_terms.add(skill)
+                start = max(0, skill_pos - 50)
+                end = skill_pos + len(skill) + 50
+                if self._has_cue(required_cues, start, end):
+                    context = 'required'
+                elif self._has_cue(preferred_cues, start, end):
+                    context = 'preferred'
+                else:
+                    # Default to required if no context
+                    context = 'required'
+            
+            if section == 'required' or context == 'required':
+                labels[canonical_skill] = 'required'
+            elif section == 'preferred' or context == 'preferred':
+                labels.setdefault(canonical_skill, 'preferred')
+        
+        required_skills = {skill for skill, label in labels.items() if label == 'required'}
+        preferred_skills = {skill for skill, label in labels.items() if label == 'preferred'}
+        
+        jd_data['required_skills'] = self._canonical_skills(required_skills)
+        jd_data['preferred_skills'] = self._canonical_skills(preferred_skills)
         
         return jd_data
\ No newline at end of file
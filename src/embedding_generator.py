@@ -2,57 +2,268 @@
 Embedding Generator using SentenceTransformers
 """
 import numpy as np
-from typing import List, Optional
+from typing import Dict, List, Optional
 import hashlib
+import re
+import threading
+
+try:
+    import diskcache  # Persistent embedding cache (optional)
+except ImportError:
+    diskcache = None
+
+# Loaded models shared by every EmbeddingGenerator in the process, keyed by name
+_MODELS: Dict[str, object] = {}
+_MODELS_LOCK = threading.Lock()
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Dynamically quantized int8 ONNX export shipped in the sentence-transformers model repos
+_ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
 
 class EmbeddingGenerator:
     """Generate embeddings for semantic matching"""
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    # Every embedding handed out is unit length (model output is normalized at
+    # encode time, cache hits and fallbacks are renormalized), so similarities
+    # are plain dot products
+    normalized = True
+    
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_dir: Optional[str] = None,
+                 dtype: np.dtype = np.float32, quantized: bool = False, backend: str = "torch",
+                 torch_int8: bool = False):
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"Unknown embedding backend: {backend!r} (use 'torch' or 'onnx')")
         self.model_name = model_name
         self.model = None
+        
+        # Run the model through ONNX Runtime ("onnx") instead of PyTorch ("torch");
+        # quantized uses the int8 ONNX export
+        self.backend = backend
+        self.quantized = quantized
+        
+        # Opt-in: dynamically quantize the torch model to int8 whenever the torch
+        # model is what loads (CPU only; embeddings drift slightly from FP32)
+        self.torch_int8 = torch_int8
+        self._loaded_key = None  # Variant that actually loaded (see _model_key)
         self.dimension = 384  # Default for MiniLM
+        
+        # Output dtype; float16 halves memory traffic for large candidate sets
+        self.dtype = np.dtype(dtype)
+        
+        # Model embeddings keyed by content hash, stored as raw float16 bytes on disk
+        self.cache = None
+        if cache_dir and diskcache is not None:
+            try:
+                self.cache = diskcache.Cache(cache_dir)
+            except Exception as e:
+                # e.g. a read-only deploy; embeddings are then computed every time
+                print(f"Embedding cache unavailable ({e}); caching disabled")
+    
+    @property
+    def _model_key(self) -> str:
+        """
+        Name of the model variant, used for sharing and cache keys: the one
+        requested until the model is loaded, then the one that actually
+        loaded (e.g. the FP32 model when the int8 export is unavailable)
+        """
+        if self._loaded_key is not None:
+            return self._loaded_key
+        if self.quantized:
+            return f"{self.model_name}:int8"
+        if self.backend == "onnx":
+            return f"{self.model_name}:onnx"
+        if self.torch_int8:
+            return f"{self.model_name}:torch-int8"
+        return self.model_name
     
     def _load_model(self):
-        """Lazy load model"""
+        """Lazy load model (once per process, shared across instances)"""
         if self.model is None:
-            try:
-                from sentence_transformers import SentenceTransformer
-                print(f"Loading embedding model: {self.model_name}")
-                self.model = SentenceTransformer(self.model_name)
-                # Get actual dimension
-                test_emb = self.model.encode(["test"])
-                self.dimension = len(test_emb[0])
-                print(f"Model loaded ({self.dimension} dimensions)")
-            except ImportError:
-                raise ImportError("Install sentence-transformers: pip install sentence-transformers")
+            with _MODELS_LOCK:
+                entry = _MODELS.get(self._model_key)
+                if entry is None:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                    except ImportError:
+                        raise ImportError("Install sentence-transformers: pip install sentence-transformers")
+                    print(f"Loading embedding model: {self._model_key}")
+                    model = None
+                    if self.quantized:
+                        model = self._load_onnx_model(SentenceTransformer, _ONNX_INT8_FILE)
+                        loaded_key = f"{self.model_name}:int8"
+                    elif self.backend == "onnx":
+                        model = self._load_onnx_model(SentenceTransformer)
+                        loaded_key = f"{self.model_name}:onnx"
+                    if model is None:
+                        model, loaded_key = SentenceTransformer(self.model_name), self.model_name
+                        if self.torch_int8:
+                            quantized_model = self._quantize_torch_model(model)
+                            if quantized_model is not None:
+                                model, loaded_key = quantized_model, f"{self.model_name}:torch-int8"
+                    # Shared under the requested key, labelled with what loaded
+                    entry = _MODELS[self._model_key] = (model, loaded_key)
+                    print(f"Model loaded: {loaded_key} ({model.get_sentence_embedding_dimension()} dimensions)")
+            
+            self.model, self._loaded_key = entry
+            self.dimension = self.model.get_sentence_embedding_dimension() or self.dimension
+    
+    def _load_onnx_model(self, sentence_transformer, file_name: Optional[str] = None):
+        """
+        The model's ONNX export (file_name, or the FP32 export by default) on
+        ONNX Runtime's CPU provider, or None.
+        
+        SentenceTransformer keeps its own tokenization, pooling and normalization
+        for the ONNX backend, so embeddings keep their meaning; a model without
+        an ONNX file is exported on load. Needs sentence-transformers>=3.2 with
+        optimum[onnxruntime].
+        """
+        model_kwargs = {"provider": "CPUExecutionProvider"}
+        if file_name:
+            model_kwargs["file_name"] = file_name
+        try:
+            return sentence_transformer(self.model_name, backend="onnx", model_kwargs=model_kwargs)
+        except Exception as e:
+            print(f"ONNX model unavailable ({e}); using the torch model")
+            return None
+    
+    @staticmethod
+    def _quantize_torch_model(model):
+        """
+        Dynamic int8 quantization of the torch model's Linear layers (the
+        torch_int8 option), or None. Quantized Linear layers only run on CPU,
+        so a model placed on another device is left at full precision.
+        """
+        device = getattr(getattr(model, "device", None), "type", "cpu")
+        if device != "cpu":
+            print(f"int8 quantization needs the CPU (model is on {device}); using full precision")
+            return None
+        try:
+            import torch
+            return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        except Exception as e:
+            print(f"int8 quantization unavailable ({e}); using full precision")
+            return None
+    
+    def _cache_key(self, text: str) -> str:
+        """Cache key for text under the current model"""
+        return f"{self._model_key}:{hashlib.blake2b(text.encode(), digest_size=16).hexdigest()}"
+    
+    def _cache_get(self, text: str) -> Optional[np.ndarray]:
+        """Cached embedding for text, if any"""
+        if self.cache is None:
+            return None
+        
+        cached = self.cache.get(self._cache_key(text))
+        return None if cached is None else self._decode_cached(cached)
+    
+    @staticmethod
+    def _decode_cached(data: bytes) -> np.ndarray:
+        """Embedding from cached float16 bytes"""
+        # Undo float16 rounding drift so the vector stays unit length
+        embedding = np.frombuffer(data, dtype=np.float16).astype(np.float32)
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm > 0 else embedding
+    
+    def _cache_set(self, text: str, embedding: np.ndarray) -> np.ndarray:
+        """
+        Store a model embedding in the cache. Returns it as later cache hits
+        will (float16-rounded), so a text scores the same before and after
+        it is cached
+        """
+        if self.cache is None:
+            return embedding
+        data = embedding.astype(np.float16).tobytes()
+        self.cache.set(self._cache_key(text), data)
+        return self._decode_cached(data)
+    
+    def load(self) -> bool:
+        """
+        Load the model now rather than on first use, e.g. in a background
+        thread while documents are parsed. Returns False if it cannot be
+        loaded (embeddings then use the fallback)
+        """
+        try:
+            self._load_model()
+            return True
+        except Exception as e:
+            print(f"Embedding model unavailable: {e}")
+            return False
     
     def get_embedding(self, text: str) -> np.ndarray:
-        """Get embedding for text"""
+        """Get unit-length embedding for text"""
         try:
+            cached = self._cache_get(text)
+            if cached is not None:
+                return cached.astype(self.dtype, copy=False)
+            
+            requested_key = self._model_key
             self._load_model()
+            if self._model_key != requested_key:
+                # Another variant loaded than requested; it has its own cache entries
+                cached = self._cache_get(text)
+                if cached is not None:
+                    return cached.astype(self.dtype, copy=False)
             
             # Clean and limit text
             text_clean = self._preprocess_text(text, max_length=1000)
             
             # Generate embedding
-            embedding = self.model.encode([text_clean])[0]
+            embedding = self.model.encode([text_clean], convert_to_numpy=True,
+                                          normalize_embeddings=True, show_progress_bar=False)[0]
             
             if not isinstance(embedding, np.ndarray):
                 embedding = np.array(embedding, dtype=np.float32)
             
-            return embedding
+            embedding = self._cache_set(text, embedding)
+            return embedding.astype(self.dtype, copy=False)
             
         except Exception as e:
             print(f"Embedding error: {e}")
-            return self._fallback_embedding(text)
+            return self._fallback_embedding(text).astype(self.dtype, copy=False)
     
-    def _preprocess_text(self, text: str, max_length: int = 1000) -> str:
-        """Preprocess text for embedding"""
-        import re
+    def get_embeddings_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """Get unit-length embeddings for several texts, batch_size per forward pass"""
+        cached = [None] * len(texts)
+        misses = list(range(len(texts)))
+        try:
+            cached = [self._cache_get(text) for text in texts]
+            misses = [i for i, embedding in enumerate(cached) if embedding is None]
+            if not misses:
+                return np.stack(cached).astype(self.dtype, copy=False)
+            
+            requested_key = self._model_key
+            self._load_model()
+            if self._model_key != requested_key:
+                # Another variant loaded than requested; it has its own cache entries
+                for i in misses:
+                    cached[i] = self._cache_get(texts[i])
+                misses = [i for i in misses if cached[i] is None]
+            
+            if misses:
+                texts_clean = [self._preprocess_text(texts[i], max_length=1000) for i in misses]
+                embeddings = self.model.encode(texts_clean, batch_size=batch_size,
+                                               convert_to_numpy=True, normalize_embeddings=True,
+                                               show_progress_bar=False)
+                
+                for i, embedding in zip(misses, np.asarray(embeddings, dtype=np.float32)):
+                    cached[i] = self._cache_set(texts[i], embedding)
+            
+        except Exception as e:
+            print(f"Embedding error: {e}")
+            for i in misses:
+                cached[i] = self._fallback_embedding(texts[i])
         
+        return np.stack(cached).astype(self.dtype, copy=False)
+    
+    def _preprocess_text(self, text: str, max_length: int = 1000) -> str:
+        """
+        Preprocess text for embedding. The character cap only bounds string
+        work here; encode() truncates to the model's max_seq_length tokens in
+        the same tokenizer pass, so no separate token-level truncation is done
+        """
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         # Truncate if too long
         if len(text) > max_length:
@@ -63,35 +274,42 @@ class EmbeddingGenerator:
     
     def _fallback_embedding(self, text: str) -> np.ndarray:
         """Fallback when model fails"""
-        text_hash = hashlib.sha256(text.encode()).hexdigest()
-        seed = int(text_hash[:8], 16)
-        
-        np.random.seed(seed)
-        embedding = np.random.randn(self.dimension).astype(np.float32)
+        # Deterministic per text; a local Generator leaves global NumPy state alone
+        seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), 'little')
+        rng = np.random.default_rng(seed)
+        embedding = rng.standard_normal(self.dimension, dtype=np.float32)
         
         # Normalize
-        norm = np.linalg.norm(embedding)
-        if norm > 0:
-            embedding = embedding / norm
+        embedding /= np.linalg.norm(embedding) or 1.0
         
         return embedding
     
     def get_similarity(self, emb1: np.ndarray, emb2: np.ndarray) -> float:
-        """Calculate cosine similarity between embeddings"""
+        """Calculate cosine similarity between embeddings from this generator
+
+        Embeddings are unit length (see `normalized`), so the cosine is a
+        plain dot product; no norms are computed here.
+        """
         if emb1 is None or emb2 is None:
             return 0.0
         
+        emb1 = emb1.ravel()
+        emb2 = emb2.ravel()
+        
         # Ensure same shape
         if emb1.shape != emb2.shape:
-            min_dim = min(len(emb1), len(emb2))
+            min_dim = min(emb1.shape[0], emb2.shape[0])
             emb1 = emb1[:min_dim]
             emb2 = emb2[:min_dim]
         
-        dot = np.dot(emb1, emb2)
-        norm1 = np.linalg.norm(emb1)
-        norm2 = np.linalg.norm(emb2)
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return float(dot / (norm1 * norm2))
\ No newline at end of file
+        return float(emb1.astype(np.float32, copy=False) @ emb2.astype(np.float32, copy=False))
+    
+    def similarity_matrix(self, embeddings_a: np.ndarray, embeddings_b: np.ndarray) -> np.ndarray:
+        """Cosine similarities of every row of embeddings_a with every row of embeddings_b
+
+        Rows from this generator are unit length, so this is one float32 matrix
+        product (BLAS sgemm) of shape (len(embeddings_a), len(embeddings_b)).
+        """
+        a = np.ascontiguousarray(np.atleast_2d(embeddings_a), dtype=np.float32)
+        b = np.ascontiguousarray(np.atleast_2d(embeddings_b), dtype=np.float32)
+        return a @ b.T
@@ -6,11 +6,94 @@ Version: 1.0.0
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Tuple, Optional, Any
 import logging
+import threading
+
+try:
+    from ._kernels import (HAVE_NUMBA, cos_sim, count_sorted_intersections, pack_skill_bits,
+                           popcount_rows, skill_scores_from_counts)
+except ImportError:
+    from _kernels import (HAVE_NUMBA, cos_sim, count_sorted_intersections, pack_skill_bits,
+                          popcount_rows, skill_scores_from_counts)
+
+try:
+    import simsimd  # SIMD cosine kernels (optional)
+except ImportError:
+    simsimd = None
+
+try:
+    from rapidfuzz import fuzz, process  # C++ edit-distance matching (optional)
+except ImportError:
+    fuzz = process = None
 
 logger = logging.getLogger(__name__)
 
+# Guards skill vocabulary growth in MatchingEngine.skill_ids; module level so
+# engines stay picklable for batch_match worker processes
+_SKILL_VOCAB_LOCK = threading.Lock()
+
+# Vocabulary size up to which corpus scoring uses dense uint64 skill bitsets
+_BITSET_MAX_VOCAB = 4096
+
+
+# Engine, job and options each batch_match worker process received at start-up
+_batch_worker_state: Optional[Tuple[Any, Dict[str, Any], bool, int]] = None
+
+
+def _init_batch_worker(engine: 'MatchingEngine', job_data: Dict[str, Any],
+                       include_details: bool, total: int):
+    """ProcessPoolExecutor initializer: keep the shared batch state for this worker"""
+    global _batch_worker_state
+    _batch_worker_state = (engine, job_data, include_details, total)
+
+
+def _batch_match_worker(task: Tuple[int, Dict[str, Any], Optional[float]]) -> Dict[str, Any]:
+    """batch_match task: score one resume in a worker process"""
+    engine, job_data, include_details, total = _batch_worker_state
+    index, resume_data, semantic_score = task
+    return engine._batch_match_one(index, resume_data, job_data, semantic_score,
+                                   include_details, total)
+
+
+# Education hierarchy (higher number = higher level); the first key found in
+# an entry decides its level
+_EDUCATION_HIERARCHY = (
+    ('high school', 1),
+    ('associate', 2),
+    ('bachelor', 3),
+    ('bs', 3),
+    ('ba', 3),
+    ('master', 4),
+    ('ms', 4),
+    ('ma', 4),
+    ('mba', 4),
+    ('phd', 5),
+    ('doctorate', 5),
+    ('ph.d', 5)
+)
+
+
+@lru_cache(maxsize=4096)
+def _education_level(education: str) -> Optional[int]:
+    """Hierarchy level of an education entry, memoized since entries recur across matches"""
+    education_lower = education.lower()
+    for level, value in _EDUCATION_HIERARCHY:
+        if level in education_lower:
+            return value
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _normalized_skill_set(skills: Tuple[str, ...]) -> FrozenSet[str]:
+    """Casefolded, whitespace-collapsed skill set, memoized per skill tuple"""
+    # Remove extra whitespace and casefold (Unicode-aware lowercase); split()
+    # already strips, so blank skills come out empty and are filtered after
+    return frozenset(filter(None, (' '.join(skill.split()).casefold() for skill in skills)))
+
 
 class MatchingEngine:
     """
@@ -25,7 +108,9 @@ class MatchingEngine:
     - Configurable weight system
     """
     
-    def __init__(self, weights: Optional[Dict[str, float]] = None):
+    def __init__(self, weights: Optional[Dict[str, float]] = None,
+                 prenormalized: bool = False,
+                 fuzzy_threshold: Optional[float] = None):
         """
         Initialize the matching engine with configurable weights.
         
@@ -38,6 +123,12 @@ class MatchingEngine:
                     'education': 0.15,
                     'semantic': 0.05
                 }
+            prenormalized (bool): Embeddings passed to the engine are already
+                unit length, so cosine similarity reduces to a dot product.
+            fuzzy_threshold (float, optional): Similarity (0-100) at which a
+                missing job skill counts as matched by a near-identical resume
+                skill, e.g. 'postgres' vs 'postgresql'. Off by default; needs
+                rapidfuzz and applies to match()/calculate_skill_score only.
         
         Raises:
             ValueError: If weights do not sum to 1.0
@@ -50,6 +141,15 @@ class MatchingEngine:
             'semantic': 0.05            # Contextual/semantic similarity
         }
         
+        self.prenormalized = prenormalized
+        
+        if fuzzy_threshold is not None and process is None:
+            logger.warning("rapidfuzz is not installed; fuzzy skill matching is disabled")
+            fuzzy_threshold = None
+        self.fuzzy_threshold = fuzzy_threshold
+        self._skill_index: Optional[Dict[str, Any]] = None
+        self._skill_vocab: Dict[str, int] = {}
+        
         # Validate weights sum to 1.0
         total_weight = sum(self.weights.values())
         if abs(total_weight - 1.0) > 0.001:
@@ -70,14 +170,46 @@ class MatchingEngine:
         if not skills:
             return []
         
-        normalized_skills = set()
-        for skill in skills:
-            if isinstance(skill, str) and skill.strip():
-                # Remove extra whitespace and convert to lowercase
-                clean_skill = ' '.join(skill.strip().lower().split())
-                normalized_skills.add(clean_skill)
+        return sorted(self.skill_set(skills))
+    
+    def skill_set(self, skills: Iterable[str]) -> FrozenSet[str]:
+        """
+        Build the normalized skill set used for matching.
+        
+        Results are memoized per distinct skill list, so a document matched
+        against many others is normalized once.
         
-        return sorted(list(normalized_skills))
+        Args:
+            skills (Iterable[str]): Skill strings
+            
+        Returns:
+            FrozenSet[str]: Casefolded, whitespace-collapsed skills
+        """
+        if isinstance(skills, frozenset):
+            return skills
+        
+        return _normalized_skill_set(tuple(skill for skill in skills if isinstance(skill, str)))
+    
+    def prepare_skill_sets(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cache normalized skill sets on parsed resume/job data.
+        
+        Use when the same document is matched many times so the sets are
+        built once instead of on every match call.
+        
+        Args:
+            data (Dict[str, Any]): Parsed resume or job description data
+            
+        Returns:
+            Dict[str, Any]: The same dict with '_skills_set', '_required_set'
+                and '_preferred_set' added where the source lists exist
+        """
+        for source_key, cache_key in (('skills', '_skills_set'),
+                                      ('required_skills', '_required_set'),
+                                      ('preferred_skills', '_preferred_set')):
+            if source_key in data:
+                data[cache_key] = self.skill_set(data[source_key])
+        return data
     
     def calculate_cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         """
@@ -94,9 +226,14 @@ class MatchingEngine:
             return 0.0
         
         try:
-            # Ensure vectors are 1D
-            vec1_flat = vec1.flatten().astype(np.float32)
-            vec2_flat = vec2.flatten().astype(np.float32)
+            # Ensure vectors are 1D; simsimd handles half precision natively,
+            # the NumPy path upcasts to float32
+            if simsimd is not None and vec1.dtype == vec2.dtype == np.float16:
+                vec1_flat = vec1.ravel()
+                vec2_flat = vec2.ravel()
+            else:
+                vec1_flat = vec1.ravel().astype(np.float32, copy=False)
+                vec2_flat = vec2.ravel().astype(np.float32, copy=False)
             
             # Handle dimension mismatch
             if len(vec1_flat) != len(vec2_flat):
@@ -104,50 +241,134 @@ class MatchingEngine:
                 vec1_flat = vec1_flat[:min_len]
                 vec2_flat = vec2_flat[:min_len]
             
-            # Calculate dot product and norms
-            dot_product = np.dot(vec1_flat, vec2_flat)
-            norm1 = np.linalg.norm(vec1_flat)
-            norm2 = np.linalg.norm(vec2_flat)
+            if self.prenormalized and vec1_flat.dtype == np.float32:
+                return float(max(vec1_flat.dot(vec2_flat), 0.0))
             
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            similarity = dot_product / (norm1 * norm2)
+            if simsimd is not None:
+                if not vec1_flat.any() or not vec2_flat.any():
+                    return 0.0
+                # simsimd returns cosine distance
+                similarity = 1.0 - float(simsimd.cosine(vec1_flat, vec2_flat))
+            elif HAVE_NUMBA:
+                similarity = cos_sim(np.ascontiguousarray(vec1_flat), np.ascontiguousarray(vec2_flat))
+            else:
+                # sqrt(v.dot(v)) avoids the linalg.norm dispatch overhead
+                norm_product = np.sqrt(vec1_flat.dot(vec1_flat) * vec2_flat.dot(vec2_flat))
+                if norm_product == 0:
+                    return 0.0
+                similarity = vec1_flat.dot(vec2_flat) / norm_product
             return float(max(similarity, 0.0))  # Ensure non-negative
             
         except Exception as e:
             logger.warning(f"Cosine similarity calculation failed: {e}")
             return 0.0
     
-    def calculate_skill_score(self, resume_skills: List[str], 
-                            job_required_skills: List[str], 
-                            job_preferred_skills: List[str]) -> Dict[str, Any]:
+    def calculate_similarity_matrix(self, resume_embeddings: np.ndarray,
+                                    job_embeddings: np.ndarray) -> np.ndarray:
         """
-        Calculate detailed skill matching score with breakdown.
+        Calculate cosine similarities for every resume/job pair in one matrix product.
         
         Args:
-            resume_skills (List[str]): Skills from resume
-            job_required_skills (List[str]): Required skills from job
-            job_preferred_skills (List[str]): Preferred skills from job
+            resume_embeddings (np.ndarray): Resume embeddings, shape (N, D)
+            job_embeddings (np.ndarray): Job embeddings, shape (M, D)
             
         Returns:
-            Dict[str, Any]: Detailed skill matching results
+            np.ndarray: Non-negative similarity scores, shape (N, M)
+        """
+        resumes = self._unit_rows(resume_embeddings)
+        jobs = self._unit_rows(job_embeddings)
+        return np.maximum(resumes @ jobs.T, 0.0)
+    
+    def calculate_pairwise_similarity(self, resume_embeddings: np.ndarray,
+                                      job_embeddings: np.ndarray) -> np.ndarray:
         """
-        # Normalize all skills
-        resume_skills_norm = self.normalize_skills(resume_skills)
-        required_skills_norm = self.normalize_skills(job_required_skills)
-        preferred_skills_norm = self.normalize_skills(job_preferred_skills)
+        Calculate cosine similarity of each resume with the job in the same row.
         
-        # Convert to sets for efficient operations
-        resume_set = set(resume_skills_norm)
-        required_set = set(required_skills_norm)
-        preferred_set = set(preferred_skills_norm)
+        Only the N row-wise dot products are computed, not the N x N matrix.
         
-        # Calculate matches
-        required_matches = list(resume_set.intersection(required_set))
-        preferred_matches = list(resume_set.intersection(preferred_set))
-        missing_required = list(required_set - resume_set)
-        missing_preferred = list(preferred_set - resume_set)
+        Args:
+            resume_embeddings (np.ndarray): Resume embeddings, shape (N, D)
+            job_embeddings (np.ndarray): Job embeddings, shape (N, D)
+            
+        Returns:
+            np.ndarray: Non-negative similarity scores, shape (N,)
+        """
+        resumes = self._unit_rows(resume_embeddings)
+        jobs = self._unit_rows(job_embeddings)
+        return np.maximum(np.einsum('ij,ij->i', resumes, jobs), 0.0)
+    
+    def _unit_rows(self, embeddings: np.ndarray) -> np.ndarray:
+        """float32 (N, D) view of embeddings with unit-length rows"""
+        if self.prenormalized:
+            return np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        
+        # Private copy, normalized in place
+        matrix = np.array(embeddings, dtype=np.float32, ndmin=2)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        return matrix
+    
+    def _fuzzy_split(self, matches: List[str], missing: List[str],
+                     resume_set: FrozenSet[str]) -> Tuple[List[str], List[str]]:
+        """
+        Move missing skills with a close resume spelling into the matches.
+        
+        Scores every missing/resume pair in one rapidfuzz cdist call (Indel
+        ratio, computed bit-parallel in C++) rather than a Python loop.
+        
+        Returns:
+            Tuple[List[str], List[str]]: Updated matches and still-missing skills
+        """
+        scores = process.cdist(missing, list(resume_set), scorer=fuzz.ratio,
+                               score_cutoff=self.fuzzy_threshold, dtype=np.uint8)
+        close = scores.max(axis=1) >= self.fuzzy_threshold
+        return (matches + [skill for skill, hit in zip(missing, close) if hit],
+                [skill for skill, hit in zip(missing, close) if not hit])
+    
+    @staticmethod
+    def _split_by_membership(job_set: FrozenSet[str],
+                             resume_set: FrozenSet[str]) -> Tuple[List[str], List[str]]:
+        """Split job skills into (found in resume_set, missing from it)"""
+        found = []
+        missing = []
+        for skill in job_set:
+            (found if skill in resume_set else missing).append(skill)
+        return found, missing
+    
+    def calculate_skill_score(self, resume_skills: Iterable[str], 
+                            job_required_skills: Iterable[str], 
+                            job_preferred_skills: Iterable[str]) -> Dict[str, Any]:
+        """
+        Calculate detailed skill matching score with breakdown.
+        
+        Args:
+            resume_skills (Iterable[str]): Skills from resume
+            job_required_skills (Iterable[str]): Required skills from job
+            job_preferred_skills (Iterable[str]): Preferred skills from job
+                (frozensets from skill_set() are used without re-normalizing)
+            
+        Returns:
+            Dict[str, Any]: Detailed skill matching results
+        """
+        # Normalize all skills into sets for efficient operations
+        resume_set = self.skill_set(resume_skills)
+        required_set = self.skill_set(job_required_skills)
+        preferred_set = self.skill_set(job_preferred_skills)
+        
+        # Calculate matches: one membership test per job skill puts it in
+        # exactly one of the two lists, with no intermediate sets
+        required_matches, missing_required = self._split_by_membership(required_set, resume_set)
+        preferred_matches, missing_preferred = self._split_by_membership(preferred_set, resume_set)
+        
+        # Optionally accept near-identical spellings for skills with no exact match
+        if self.fuzzy_threshold is not None and resume_set:
+            if missing_required:
+                required_matches, missing_required = self._fuzzy_split(
+                    required_matches, missing_required, resume_set)
+            if missing_preferred:
+                preferred_matches, missing_preferred = self._fuzzy_split(
+                    preferred_matches, missing_preferred, resume_set)
         
         # Calculate coverage scores
         required_coverage = (len(required_matches) / len(required_set) 
@@ -169,11 +390,243 @@ class MatchingEngine:
             'missing_preferred': missing_preferred,
             'required_coverage': f"{len(required_matches)}/{len(required_set)}",
             'preferred_coverage': f"{len(preferred_matches)}/{len(preferred_set)}",
-            'resume_skill_count': len(resume_skills_norm),
+            'resume_skill_count': len(resume_set),
             'required_skill_count': len(required_set),
             'preferred_skill_count': len(preferred_set)
         }
     
+    def build_skill_index(self, jobs_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build an inverted skill -> job index over a corpus of job descriptions.
+        
+        Args:
+            jobs_data (List[Dict[str, Any]]): Parsed job description data
+            
+        Returns:
+            Dict[str, Any]: Posting lists and per-job skill counts; also kept
+                as the default index for match_resume_vs_corpus
+        """
+        required_index = defaultdict(list)
+        preferred_index = defaultdict(list)
+        required_counts = []
+        preferred_counts = []
+        
+        for job_index, job_data in enumerate(jobs_data):
+            required_set = self.skill_set(job_data.get('_required_set', job_data.get('required_skills', [])))
+            preferred_set = self.skill_set(job_data.get('_preferred_set', job_data.get('preferred_skills', [])))
+            for skill in required_set:
+                required_index[skill].append(job_index)
+            for skill in preferred_set:
+                preferred_index[skill].append(job_index)
+            required_counts.append(len(required_set))
+            preferred_counts.append(len(preferred_set))
+        
+        self._skill_index = {
+            'required': dict(required_index),
+            'preferred': dict(preferred_index),
+            'required_counts': required_counts,
+            'preferred_counts': preferred_counts
+        }
+        logger.info(f"Skill index built over {len(jobs_data)} jobs")
+        return self._skill_index
+    
+    def match_resume_vs_corpus(self, resume_skills: Iterable[str],
+                               min_required_matches: int = 0,
+                               skill_index: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Score a resume's skills against every indexed job via the posting lists.
+        
+        Args:
+            resume_skills (Iterable[str]): Skills from resume
+            min_required_matches (int): Drop jobs with fewer required-skill matches;
+                jobs without required skills always pass (as in shortlist)
+            skill_index (Dict[str, Any], optional): Index from build_skill_index;
+                defaults to the most recently built one
+            
+        Returns:
+            List[Dict[str, Any]]: Per-job skill scores sorted by score (descending)
+        """
+        skill_index = skill_index or self._skill_index
+        if skill_index is None:
+            raise ValueError("No skill index built; call build_skill_index first")
+        
+        required_hits = Counter()
+        preferred_hits = Counter()
+        for skill in self.skill_set(resume_skills):
+            required_hits.update(skill_index['required'].get(skill, ()))
+            preferred_hits.update(skill_index['preferred'].get(skill, ()))
+        
+        results = []
+        for job_index, (required_total, preferred_total) in enumerate(
+                zip(skill_index['required_counts'], skill_index['preferred_counts'])):
+            required_matches = required_hits[job_index]
+            if required_total and required_matches < min_required_matches:
+                continue
+            
+            # Same weighting as calculate_skill_score
+            preferred_matches = preferred_hits[job_index]
+            required_coverage = required_matches / required_total if required_total else 1.0
+            preferred_coverage = preferred_matches / preferred_total if preferred_total else 1.0
+            if required_total:
+                skill_score = (required_coverage * 0.7) + (preferred_coverage * 0.3)
+            else:
+                skill_score = preferred_coverage
+            
+            results.append({
+                'job_index': job_index,
+                'skill_score': skill_score * 100,
+                'required_coverage': f"{required_matches}/{required_total}",
+                'preferred_coverage': f"{preferred_matches}/{preferred_total}"
+            })
+        
+        results.sort(key=lambda x: x['skill_score'], reverse=True)
+        return results
+    
+    def skill_ids(self, skills: Iterable[str]) -> np.ndarray:
+        """
+        Map skills to sorted integer ids from the engine's skill vocabulary.
+        
+        Args:
+            skills (Iterable[str]): Skill strings (normalized via skill_set)
+            
+        Returns:
+            np.ndarray: Sorted, unique int32 skill ids
+        """
+        skills = self.skill_set(skills)
+        vocab = self._skill_vocab
+        # Engines are shared across threads (e.g. ai_matcher.shortlist); two
+        # unguarded inserts could hand out the same id to different skills
+        with _SKILL_VOCAB_LOCK:
+            ids = [vocab.setdefault(skill, len(vocab)) for skill in skills]
+        return np.array(sorted(ids), dtype=np.int32)
+    
+    def _skill_id_rows(self, skill_lists: List[Iterable[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Concatenated skill ids plus row offsets (CSR layout) for several skill lists"""
+        rows = [self.skill_ids(skills) for skills in skill_lists]
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=offsets[1:])
+        ids = np.concatenate(rows) if rows else np.empty(0, dtype=np.int32)
+        return ids, offsets
+    
+    def _count_skill_matches(self, resume_ids: np.ndarray, ids: np.ndarray,
+                             offsets: np.ndarray) -> np.ndarray:
+        """Number of resume skills found in each CSR row of job skill ids"""
+        vocab_size = len(self._skill_vocab)
+        if vocab_size <= _BITSET_MAX_VOCAB:
+            n_words = max((vocab_size + 63) // 64, 1)
+            resume_bits = pack_skill_bits(resume_ids, np.array([0, len(resume_ids)]), n_words)
+            return popcount_rows(pack_skill_bits(ids, offsets, n_words) & resume_bits)
+        return count_sorted_intersections(resume_ids, ids, offsets)
+    
+    def _skill_match_counts(self, resume_skills: Iterable[str],
+                            skill_lists: List[Iterable[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Matched-skill count and skill count for each job skill list.
+        
+        Exact matching runs on integer skill ids. With fuzzy_threshold set,
+        each list is split like calculate_skill_score does (exact, then
+        fuzzy), so counts agree with match().
+        """
+        if self.fuzzy_threshold is None:
+            resume_ids = self.skill_ids(resume_skills)
+            ids, offsets = self._skill_id_rows(skill_lists)
+            return self._count_skill_matches(resume_ids, ids, offsets), np.diff(offsets)
+        
+        resume_set = self.skill_set(resume_skills)
+        matches = np.zeros(len(skill_lists), dtype=np.int64)
+        totals = np.zeros(len(skill_lists), dtype=np.int64)
+        for row, skills in enumerate(skill_lists):
+            job_set = self.skill_set(skills)
+            found, missing = self._split_by_membership(job_set, resume_set)
+            if missing and resume_set:
+                found, missing = self._fuzzy_split(found, missing, resume_set)
+            matches[row] = len(found)
+            totals[row] = len(job_set)
+        return matches, totals
+    
+    def shortlist(self, resume_data: Dict[str, Any], jobs_data: List[Dict[str, Any]],
+                  min_required: int = 1,
+                  resume_embedding: Optional[np.ndarray] = None,
+                  job_embeddings: Optional[np.ndarray] = None) -> List[Tuple[int, Optional[float]]]:
+        """
+        Filter jobs on required-skill overlap before any embedding comparison.
+        
+        Args:
+            resume_data (Dict[str, Any]): Parsed resume data
+            jobs_data (List[Dict[str, Any]]): Parsed job description data
+            min_required (int): Minimum number of matched required skills;
+                jobs without required skills always pass
+            resume_embedding (np.ndarray, optional): Resume embedding
+            job_embeddings (np.ndarray, optional): Job embeddings, shape (M, D)
+            
+        Returns:
+            List[Tuple[int, Optional[float]]]: (job index, semantic score) for
+                each surviving job; the score is computed only for survivors
+                and is None when no embeddings are given
+        """
+        resume_skills = resume_data.get('_skills_set', resume_data.get('skills', []))
+        required_matches, required_totals = self._skill_match_counts(
+            resume_skills, [job.get('_required_set', job.get('required_skills', [])) for job in jobs_data])
+        keep = (required_matches >= min_required) | (required_totals == 0)
+        survivors = np.flatnonzero(keep)
+        
+        if resume_embedding is None or job_embeddings is None or not len(survivors):
+            return [(int(j), None) for j in survivors]
+        
+        semantic_scores = self.calculate_similarity_matrix(
+            resume_embedding, np.asarray(job_embeddings)[survivors])[0]
+        return [(int(j), float(score)) for j, score in zip(survivors, semantic_scores)]
+    
+    def score_corpus(self, resume_data: Dict[str, Any], jobs_data: List[Dict[str, Any]],
+                     semantic_scores: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Overall match scores of one resume against many jobs.
+        
+        Skill overlap is computed over integer skill ids instead of per-pair
+        set building: AND + popcount on uint64 bitsets while the vocabulary is
+        small, otherwise a compiled merge over sorted ids (with fuzzy_threshold
+        set, the per-pair fuzzy split instead). The result equals
+        match()['overall_score'] for each job.
+        
+        Args:
+            resume_data (Dict[str, Any]): Parsed resume data
+            jobs_data (List[Dict[str, Any]]): Parsed job description data
+            semantic_scores (np.ndarray, optional): Resume/job cosine similarities
+            
+        Returns:
+            np.ndarray: Overall scores (0-100), one per job
+        """
+        resume_skills = resume_data.get('_skills_set', resume_data.get('skills', []))
+        required_matches, required_totals = self._skill_match_counts(
+            resume_skills, [job.get('_required_set', job.get('required_skills', [])) for job in jobs_data])
+        preferred_matches, preferred_counts = self._skill_match_counts(
+            resume_skills, [job.get('_preferred_set', job.get('preferred_skills', [])) for job in jobs_data])
+        skill_scores = skill_scores_from_counts(
+            required_matches, required_totals, preferred_matches, preferred_counts)
+        
+        resume_years = resume_data.get('experience_years', 0)
+        resume_education = resume_data.get('education', [])
+        experience_scores = np.array([
+            self.calculate_experience_score(resume_years, job.get('experience_required', 0))
+            for job in jobs_data])
+        education_scores = np.array([
+            self.calculate_education_score(resume_education, job.get('education_required', []))
+            for job in jobs_data])
+        preferred_totals = np.array([max(len(job.get('preferred_skills', [])), 1) for job in jobs_data])
+        
+        if semantic_scores is None:
+            semantic_scores = np.zeros(len(jobs_data))
+        
+        weighted_scores = (
+            self.weights['required_skills'] * (skill_scores / 100) +
+            self.weights['preferred_skills'] * (preferred_matches / preferred_totals) +
+            self.weights['experience'] * experience_scores +
+            self.weights['education'] * education_scores +
+            self.weights['semantic'] * np.maximum(np.asarray(semantic_scores, dtype=np.float64), 0.0)
+        )
+        
+        return np.minimum(weighted_scores * 100, 100)
+    
     def calculate_experience_score(self, resume_years: float, 
                                  job_required_years: float) -> float:
         """
@@ -184,7 +637,8 @@ class MatchingEngine:
             job_required_years (float): Required years from job description
             
         Returns:
-            float: Experience match score (0.0 to 1.3)
+            float: Experience match score, never above 1.3 (callers rely
+                on this and do not clamp again)
         """
         if job_required_years <= 0:
             return 1.0  # No experience requirement specified
@@ -222,30 +676,9 @@ class MatchingEngine:
         if not resume_education:
             return 0.0  # No education information provided
         
-        # Education hierarchy (higher number = higher level)
-        education_hierarchy = {
-            'high school': 1,
-            'associate': 2,
-            'bachelor': 3,
-            'bs': 3,
-            'ba': 3,
-            'master': 4,
-            'ms': 4,
-            'ma': 4,
-            'mba': 4,
-            'phd': 5,
-            'doctorate': 5,
-            'ph.d': 5
-        }
-        
         # Find highest education level in resume
-        resume_levels = []
-        for edu in resume_education:
-            edu_lower = edu.lower()
-            for level, value in education_hierarchy.items():
-                if level in edu_lower:
-                    resume_levels.append(value)
-                    break
+        resume_levels = [value for value in map(_education_level, resume_education)
+                         if value is not None]
         
         if not resume_levels:
             return 0.3  # Some credit for having education section
@@ -254,46 +687,42 @@ class MatchingEngine:
         
         # Check against job requirements
         for req_edu in job_education_required:
-            req_lower = req_edu.lower()
-            for level, value in education_hierarchy.items():
-                if level in req_lower:
-                    if max_resume_level >= value:
-                        return 1.0  # Meets or exceeds requirement
-                    else:
-                        # Partial credit based on proximity to requirement
-                        proximity_score = max_resume_level / value
-                        return max(0.3, proximity_score)
+            value = _education_level(req_edu)
+            if value is not None:
+                if max_resume_level >= value:
+                    return 1.0  # Meets or exceeds requirement
+                else:
+                    # Partial credit based on proximity to requirement
+                    proximity_score = max_resume_level / value
+                    return max(0.3, proximity_score)
         
         return 0.5  # Default partial credit if no specific match
     
-    def match(self, resume_data: Dict[str, Any], job_data: Dict[str, Any], 
-             resume_embedding: Optional[np.ndarray] = None, 
-             job_embedding: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    def _match_core(self, resume_data: Dict[str, Any], job_data: Dict[str, Any],
+                    resume_embedding: Optional[np.ndarray] = None,
+                    job_embedding: Optional[np.ndarray] = None,
+                    semantic_score: Optional[float] = None) -> Dict[str, Any]:
         """
-        Calculate comprehensive match score between resume and job.
-        
-        Args:
-            resume_data (Dict[str, Any]): Parsed resume data
-            job_data (Dict[str, Any]): Parsed job description data
-            resume_embedding (np.ndarray, optional): Resume embedding vector
-            job_embedding (np.ndarray, optional): Job description embedding vector
-            
-        Returns:
-            Dict[str, Any]: Complete match results with detailed breakdown
+        Component scores and overall score of a match, without the formatted
+        summary; match() adds that, batch_match() can skip it.
         """
-        logger.info("Calculating match score between resume and job")
+        # Fields read by both the scores and the summary, looked up once
+        job_required_skills = job_data.get('required_skills', [])
+        job_preferred_skills = job_data.get('preferred_skills', [])
+        resume_years = resume_data.get('experience_years', 0)
+        job_required_years = job_data.get('experience_required', 0)
         
-        # Skill matching
+        # Skill matching (sets cached by prepare_skill_sets are used as-is)
         skill_result = self.calculate_skill_score(
-            resume_skills=resume_data.get('skills', []),
-            job_required_skills=job_data.get('required_skills', []),
-            job_preferred_skills=job_data.get('preferred_skills', [])
+            resume_skills=resume_data.get('_skills_set') or resume_data.get('skills', []),
+            job_required_skills=job_data.get('_required_set') or job_required_skills,
+            job_preferred_skills=job_data.get('_preferred_set') or job_preferred_skills
         )
         
         # Experience matching
         experience_score = self.calculate_experience_score(
-            resume_years=resume_data.get('experience_years', 0),
-            job_required_years=job_data.get('experience_required', 0)
+            resume_years=resume_years,
+            job_required_years=job_required_years
         )
         
         # Education matching
@@ -302,46 +731,80 @@ class MatchingEngine:
             job_education_required=job_data.get('education_required', [])
         )
         
-        # Semantic similarity (if embeddings available)
-        semantic_score = 0.0
-        if resume_embedding is not None and job_embedding is not None:
+        # Semantic similarity (precomputed, or from embeddings if available)
+        if semantic_score is not None:
+            semantic_score = max(float(semantic_score), 0.0)
+        elif resume_embedding is None or job_embedding is None:
+            semantic_score = 0.0
+        else:
             semantic_score = self.calculate_cosine_similarity(
                 resume_embedding, 
                 job_embedding
             )
         
-        # Calculate weighted overall score
-        weighted_score = (
-            self.weights['required_skills'] * (skill_result['score'] / 100) +
-            self.weights['preferred_skills'] * (len(skill_result['preferred_matches']) / 
-                                              max(len(job_data.get('preferred_skills', [])), 1)) +
-            self.weights['experience'] * min(experience_score, 1.3) +
-            self.weights['education'] * education_score +
-            self.weights['semantic'] * semantic_score
-        )
+        # Weighted components, computed once for both the total and the breakdown
+        components = {
+            'required_skills': self.weights['required_skills'] * (skill_result['score'] / 100),
+            'preferred_skills': self.weights['preferred_skills'] * (len(skill_result['preferred_matches']) / 
+                                                                  max(len(job_preferred_skills), 1)),
+            'experience': self.weights['experience'] * experience_score,
+            'education': self.weights['education'] * education_score,
+            'semantic': self.weights['semantic'] * semantic_score
+        }
+        weighted_score = (components['required_skills'] + components['preferred_skills'] +
+                          components['experience'] + components['education'] +
+                          components['semantic'])
         
         # Convert to percentage and cap at 100%
         overall_score = min(weighted_score * 100, 100)
         
+        return {
+            'overall_score': overall_score,
+            'skill_details': skill_result,
+            'experience_score': experience_score,
+            'education_score': education_score,
+            'semantic_score': semantic_score,
+            'components': components
+        }
+    
+    def match(self, resume_data: Dict[str, Any], job_data: Dict[str, Any], 
+             resume_embedding: Optional[np.ndarray] = None, 
+             job_embedding: Optional[np.ndarray] = None,
+             semantic_score: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Calculate comprehensive match score between resume and job.
+        
+        Args:
+            resume_data (Dict[str, Any]): Parsed resume data
+            job_data (Dict[str, Any]): Parsed job description data
+            resume_embedding (np.ndarray, optional): Resume embedding vector
+            job_embedding (np.ndarray, optional): Job description embedding vector
+            semantic_score (float, optional): Precomputed cosine similarity
+                (e.g. from a batched similarity matrix); skips the embedding comparison
+            
+        Returns:
+            Dict[str, Any]: Complete match results with detailed breakdown
+        """
+        logger.debug("Calculating match score between resume and job")
+        
+        scores = self._match_core(resume_data, job_data, resume_embedding,
+                                  job_embedding, semantic_score)
+        skill_result = scores['skill_details']
+        experience_score = scores['experience_score']
+        education_score = scores['education_score']
+        semantic_score = scores['semantic_score']
+        components = scores['components']
+        overall_score = scores['overall_score']
+        
         # Prepare comprehensive results
         match_result = {
             'overall_score': float(overall_score),
             'skill_score': float(skill_result['score']),
-            'experience_score': float(min(experience_score, 1.3) * 100),
+            'experience_score': float(experience_score * 100),
             'education_score': float(education_score * 100),
             'semantic_score': float(semantic_score * 100),
             'skill_details': skill_result,
-            'weighted_components': {
-                'required_skills': float(self.weights['required_skills'] * 
-                                       (skill_result['score'] / 100) * 100),
-                'preferred_skills': float(self.weights['preferred_skills'] * 
-                                        (len(skill_result['preferred_matches']) / 
-                                         max(len(job_data.get('preferred_skills', [])), 1)) * 100),
-                'experience': float(self.weights['experience'] * 
-                                  min(experience_score, 1.3) * 100),
-                'education': float(self.weights['education'] * education_score * 100),
-                'semantic': float(self.weights['semantic'] * semantic_score * 100)
-            },
+            'weighted_components': {name: float(value * 100) for name, value in components.items()},
             'match_summary': {
                 'skills': f"{len(skill_result['required_matches'])}/{len(job_data.get('required_skills', []))} required skills matched",
                 'experience': f"{resume_data.get('experience_years', 0)}/{job_data.get('experience_required', 0)} years",
@@ -351,12 +814,63 @@ class MatchingEngine:
             }
         }
         
-        logger.info(f"Match calculation complete: {overall_score:.1f}%")
+        logger.debug("Match calculation complete: %.1f%%", overall_score)
         return match_result
     
+    def _batch_match_one(self, index: int, resume_data: Dict[str, Any],
+                         job_data: Dict[str, Any], semantic_score: Optional[float],
+                         include_details: bool, total: int) -> Dict[str, Any]:
+        """batch_match result for one resume; errors are reported, not raised"""
+        try:
+            if include_details:
+                match_result = self.match(resume_data=resume_data, job_data=job_data,
+                                          semantic_score=semantic_score)
+                result = {
+                    'resume_index': index,
+                    'match_score': match_result['overall_score'],
+                    'details': match_result
+                }
+            else:
+                scores = self._match_core(resume_data, job_data, semantic_score=semantic_score)
+                result = {
+                    'resume_index': index,
+                    'match_score': float(scores['overall_score'])
+                }
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Resume %d/%d: %.1f%%", index + 1, total, result['match_score'])
+            return result
+            
+        except Exception as e:
+            logger.error(f"Failed to match resume {index}: {e}")
+            return {
+                'resume_index': index,
+                'match_score': 0.0,
+                'error': str(e)
+            }
+    
+    @staticmethod
+    def _top_k_results(results: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+        """The top_k results by match_score, in their original order"""
+        if top_k <= 0:
+            return []
+        
+        scores = np.fromiter((result['match_score'] for result in results),
+                             dtype=np.float64, count=len(results))
+        cutoff = scores[np.argpartition(-scores, top_k - 1)[top_k - 1]]
+        
+        # Everything above the cut-off, then the earliest ties to fill top_k
+        above = np.flatnonzero(scores > cutoff)
+        ties = np.flatnonzero(scores == cutoff)[:top_k - len(above)]
+        return [results[i] for i in np.sort(np.concatenate((above, ties)))]
+    
     def batch_match(self, resumes_data: List[Dict[str, Any]], 
                    job_data: Dict[str, Any],
-                   resume_embeddings: Optional[List[np.ndarray]] = None) -> List[Dict[str, Any]]:
+                   resume_embeddings: Optional[List[np.ndarray]] = None,
+                   job_embedding: Optional[np.ndarray] = None,
+                   include_details: bool = True,
+                   top_k: Optional[int] = None,
+                   workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Match multiple resumes against a single job description.
         
@@ -364,42 +878,51 @@ class MatchingEngine:
             resumes_data (List[Dict[str, Any]]): List of parsed resume data
             job_data (Dict[str, Any]): Parsed job description data
             resume_embeddings (List[np.ndarray], optional): List of resume embeddings
+            job_embedding (np.ndarray, optional): Job description embedding
+            include_details (bool): Attach each full match() result as 'details'.
+                When False only scores are computed, skipping the per-resume
+                breakdown and summary formatting.
+            top_k (int, optional): Return only the top_k best matches. They are
+                selected in O(N) with np.argpartition before the final sort;
+                ties at the cut-off keep the earliest resumes.
+            workers (int, optional): Score resumes in this many worker
+                processes (e.g. os.cpu_count()); embeddings are still compared
+                in one matrix product here. Worth it for large batches only.
             
         Returns:
             List[Dict[str, Any]]: List of match results sorted by score (descending)
         """
         logger.info(f"Starting batch matching for {len(resumes_data)} resumes")
         
-        results = []
+        # Build the job's skill sets once for all resumes
+        job_data = self.prepare_skill_sets(dict(job_data))
+        
+        # Score every resume embedding against the job in a single matrix product
+        semantic_scores = None
+        if (resume_embeddings is not None and job_embedding is not None
+                and len(resume_embeddings) == len(resumes_data)):
+            semantic_scores = self.calculate_similarity_matrix(
+                np.stack(resume_embeddings), job_embedding
+            )[:, 0]
+        
+        tasks = [(i, resume_data, float(semantic_scores[i]) if semantic_scores is not None else None)
+                 for i, resume_data in enumerate(resumes_data)]
+        
+        if workers is not None and workers > 1 and len(tasks) > 1:
+            # The engine and job go to each worker once; resumes go in chunks
+            workers = min(workers, len(tasks))
+            chunksize = max(1, len(tasks) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                     initargs=(self, job_data, include_details, len(tasks))) as pool:
+                results = list(pool.map(_batch_match_worker, tasks, chunksize=chunksize))
+        else:
+            results = [self._batch_match_one(i, resume_data, job_data, semantic_score,
+                                             include_details, len(tasks))
+                       for i, resume_data, semantic_score in tasks]
         
-        for i, resume_data in enumerate(resumes_data):
-            try:
-                resume_embedding = (resume_embeddings[i] 
-                                  if resume_embeddings and i < len(resume_embeddings) 
-                                  else None)
-                
-                match_result = self.match(
-                    resume_data=resume_data,
-                    job_data=job_data,
-                    resume_embedding=resume_embedding,
-                    job_embedding=None  # Job embedding would be same for all
-                )
-                
-                results.append({
-                    'resume_index': i,
-                    'match_score': match_result['overall_score'],
-                    'details': match_result
-                })
-                
-                logger.debug(f"Resume {i+1}/{len(resumes_data)}: {match_result['overall_score']:.1f}%")
-                
-            except Exception as e:
-                logger.error(f"Failed to match resume {i}: {e}")
-                results.append({
-                    'resume_index': i,
-                    'match_score': 0.0,
-                    'error': str(e)
-                })
+        # Keep the top_k before sorting
+        if top_k is not None and top_k < len(results):
+            results = self._top_k_results(results, top_k)
         
         # Sort by match score (descending)
         results.sort(key=lambda x: x['match_score'], reverse=True)
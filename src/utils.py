@@ -9,46 +9,101 @@ Version: 1.0.0
 """
 
 import json
+import math
+import mmap
 import numpy as np
 import logging
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson  # Fast JSON encoder with native NumPy support
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+# Exact types convert_numpy_types passes through without further checks
+_PLAIN_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Container nesting beyond this is treated as a circular reference
+_MAX_NESTING = 10000
+
+
+def _container_type(obj: Any) -> Any:
+    """dict, list or tuple for (subclasses of) those containers, else None"""
+    obj_type = type(obj)
+    if obj_type is dict or obj_type is list or obj_type is tuple:
+        return obj_type
+    if obj_type in _PLAIN_TYPES:
+        return None
+    for container in (dict, list, tuple):
+        if isinstance(obj, container):
+            return container
+    return None
+
+
+def _convert_scalar(obj: Any) -> Any:
+    """Native Python value for a numpy scalar or array; anything else unchanged"""
+    if type(obj) in _PLAIN_TYPES:
+        return obj
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return obj
+
+
 def convert_numpy_types(obj: Any) -> Any:
     """
     Convert numpy types to Python native types for JSON serialization.
     
+    Walks nested dicts, lists and tuples with an explicit stack, so deep
+    nesting does not hit the recursion limit.
+    
     Args:
         obj: Any Python object that may contain numpy types
         
     Returns:
         Object with numpy types converted to Python native types
     """
-    if isinstance(obj, dict):
-        return {k: convert_numpy_types(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return tuple(convert_numpy_types(item) for item in obj)
-    elif isinstance(obj, np.generic):
-        return obj.item()
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, (np.float32, np.float64)):
-        return float(obj)
-    elif isinstance(obj, (np.int32, np.int64, np.int8, np.uint32, np.uint64)):
-        return int(obj)
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, (np.complex64, np.complex128)):
-        return complex(obj)
-    else:
-        return obj
+    container = _container_type(obj)
+    if container is None:
+        return _convert_scalar(obj)
+    
+    # Containers are copied (tuples as lists) and their items converted in place
+    root = dict(obj) if container is dict else list(obj)
+    stack = [(root, 0)]
+    tuples = [(None, None, root)] if container is tuple else []
+    
+    while stack:
+        converted, depth = stack.pop()
+        items = converted.items() if type(converted) is dict else enumerate(converted)
+        for key, value in items:
+            if type(value) in _PLAIN_TYPES:
+                continue
+            container = _container_type(value)
+            if container is None:
+                converted[key] = _convert_scalar(value)
+                continue
+            if depth >= _MAX_NESTING:
+                raise ValueError("Nesting too deep (circular reference?)")
+            child = dict(value) if container is dict else list(value)
+            converted[key] = child
+            stack.append((child, depth + 1))
+            if container is tuple:
+                tuples.append((converted, key, child))
+    
+    # Freeze tuples innermost first, so each sees its converted items
+    for parent, key, items in reversed(tuples):
+        if parent is None:
+            return tuple(items)
+        parent[key] = tuple(items)
+    
+    return root
 
 
 def save_results(results: Dict[str, Any], filename: str, 
@@ -66,24 +121,49 @@ def save_results(results: Dict[str, Any], filename: str,
         bool: True if save was successful, False otherwise
     """
     try:
-        # Add metadata
-        results_with_meta = {
-            'metadata': {
-                'generated_at': datetime.now().isoformat(),
-                'application': 'Smart Resume-Job Matcher',
-                'version': '1.0.0'
-            },
-            'results': convert_numpy_types(results)
+        metadata = {
+            'generated_at': datetime.now().isoformat(),
+            'application': 'Smart Resume-Job Matcher',
+            'version': '1.0.0'
         }
         
         # Ensure directory exists
         filepath = Path(filename)
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results_with_meta, f, indent=indent, 
-                     ensure_ascii=ensure_ascii, default=str)
+        # orjson returns bytes for one write; it only emits UTF-8 and 2-space
+        # indents. NumPy values, datetimes and dataclasses go through
+        # _orjson_default, the same conversions as the json path below, so
+        # both write the same data. Results orjson cannot write the same way
+        # take the json path: NaN/Infinity (orjson writes null) and values it
+        # rejects (e.g. ints beyond 64 bits)
+        if (orjson is not None and not ensure_ascii and indent in (None, 0, 2)
+                and not _has_non_finite(results)):
+            option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME |
+                      orjson.OPT_PASSTHROUGH_DATACLASS)
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                encoded = orjson.dumps({'metadata': metadata, 'results': results},
+                                       default=_orjson_default, option=option)
+            except orjson.JSONEncodeError as e:
+                logger.debug(f"orjson could not encode results, using json: {e}")
+            else:
+                filepath.write_bytes(encoded)
+                logger.info(f"✅ Results saved successfully to: {filename}")
+                return True
+        
+        # Add metadata
+        results_with_meta = {
+            'metadata': metadata,
+            'results': convert_numpy_types(results)
+        }
+        
+        # Encode in one go and write UTF-8 bytes with a single call, rather
+        # than streaming json.dump's small chunks through a text wrapper
+        encoded = json.dumps(results_with_meta, indent=indent,
+                             ensure_ascii=ensure_ascii, default=str)
+        filepath.write_bytes(encoded.encode('utf-8'))
         
         logger.info(f"✅ Results saved successfully to: {filename}")
         return True
@@ -106,6 +186,46 @@ def save_results(results: Dict[str, Any], filename: str,
         return False
 
 
+def _has_non_finite(obj: Any) -> bool:
+    """
+    Whether obj holds a NaN or infinite float anywhere in nested dicts,
+    lists, tuples and NumPy values. Nesting beyond _MAX_NESTING (a circular
+    reference?) also answers True, leaving the json path to report it
+    """
+    stack = [(obj, 0)]
+    while stack:
+        value, depth = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif type(value) in _PLAIN_TYPES:
+            continue
+        elif isinstance(value, (np.ndarray, np.generic)):
+            if np.issubdtype(value.dtype, np.inexact) and not np.isfinite(value).all():
+                return True
+        else:
+            container = _container_type(value)
+            if container is None:
+                continue
+            if depth >= _MAX_NESTING:
+                return True
+            items = value.values() if container is dict else value
+            stack.extend((item, depth + 1) for item in items)
+    return False
+
+
+def _orjson_default(obj: Any) -> Any:
+    """
+    orjson fallback for values it does not encode natively: NumPy values as
+    convert_numpy_types converts them, anything else as default=str does
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
 def load_results(filename: str) -> Dict[str, Any]:
     """
     Load saved results from a JSON file.
@@ -166,6 +286,55 @@ def validate_file_path(filepath: str, allowed_extensions: List[str] = None) -> b
     return True
 
 
+def safe_read_file(filepath: str) -> Optional[bytes]:
+    """
+    Read a whole file as bytes.
+    
+    The file is opened unbuffered, so the read is sized from the file's
+    length and fills one exact buffer (no BufferedReader copy).
+    
+    Args:
+        filepath: Path of the file to read
+        
+    Returns:
+        bytes: File contents, None if failed
+    """
+    try:
+        with open(filepath, 'rb', buffering=0) as f:
+            return f.read()
+    except FileNotFoundError:
+        logger.error(f"❌ File not found: {filepath}")
+        return None
+    except OSError as e:
+        logger.error(f"❌ Failed to read {filepath}: {e}")
+        return None
+
+
+def safe_mmap_file(filepath: str) -> Optional[mmap.mmap]:
+    """
+    Memory-map a file read-only, so large documents are not copied into a
+    Python bytes buffer. The mapping can be passed to
+    DocumentParser.extract_text in place of a path.
+    
+    Args:
+        filepath: Path of the file to map
+        
+    Returns:
+        mmap.mmap: Read-only mapping (close it when done), None if failed
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            # The mapping stays valid after the file object is closed
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        logger.error(f"❌ File not found: {filepath}")
+        return None
+    except (OSError, ValueError) as e:
+        # ValueError: empty files cannot be mapped
+        logger.error(f"❌ Failed to map {filepath}: {e}")
+        return None
+
+
 def format_percentage(value: float, decimals: int = 1) -> str:
     """
     Format a decimal value as a percentage string.
@@ -181,6 +350,24 @@ def format_percentage(value: float, decimals: int = 1) -> str:
     return f"{percentage:.{decimals}f}%"
 
 
+def print_match_summary(match_result: Dict[str, Any]) -> None:
+    """
+    Print a short, human-readable summary of a match result.
+    
+    Args:
+        match_result: Result of MatchingEngine.match
+    """
+    skill_details = match_result.get('skill_details', {})
+    print("=" * 50)
+    print(f"Overall match: {match_result.get('overall_score', 0.0):.1f}%")
+    for label, key in (("Skills", 'skill_score'), ("Experience", 'experience_score'),
+                       ("Education", 'education_score'), ("Semantic", 'semantic_score')):
+        print(f"  {label + ':':<12}{match_result.get(key, 0.0):6.1f}%")
+    print(f"Matched required skills: {', '.join(skill_details.get('required_matches', [])) or 'none'}")
+    print(f"Missing required skills: {', '.join(skill_details.get('missing_required', [])) or 'none'}")
+    print("=" * 50)
+
+
 def calculate_statistics(scores: List[float]) -> Dict[str, float]:
     """
     Calculate statistics for a list of match scores.
@@ -194,15 +381,28 @@ def calculate_statistics(scores: List[float]) -> Dict[str, float]:
     if not scores:
         return {}
     
-    scores_array = np.array(scores)
+    scores_array = np.asarray(scores, dtype=np.float64)
+    count = len(scores_array)
+    
+    # A NaN score makes every statistic NaN, as with np.mean/np.median/np.min;
+    # np.partition would otherwise sort it to the end and report only max as NaN
+    if np.isnan(scores_array).any():
+        nan = float('nan')
+        return {'mean': nan, 'median': nan, 'min': nan, 'max': nan, 'std': nan, 'count': count}
+    
+    # One O(N) partition places the min, the middle element(s) and the max
+    mid = count // 2
+    kth = [0, mid, count - 1] if count % 2 else [0, mid - 1, mid, count - 1]
+    ordered = np.partition(scores_array, kth)
+    median = ordered[mid] if count % 2 else (ordered[mid - 1] + ordered[mid]) / 2
     
     return {
-        'mean': float(np.mean(scores_array)),
-        'median': float(np.median(scores_array)),
-        'min': float(np.min(scores_array)),
-        'max': float(np.max(scores_array)),
-        'std': float(np.std(scores_array)),
-        'count': len(scores_array)
+        'mean': float(scores_array.mean()),
+        'median': float(median),
+        'min': float(ordered[0]),
+        'max': float(ordered[-1]),
+        'std': float(scores_array.std()),
+        'count': count
     }
 
 
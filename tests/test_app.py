@@ -0,0 +1,105 @@
+"""
+/batch_upload checked against /upload through the Flask test client
+"""
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+import app as app_module
+
+SAMPLE_RESUME = (REPO_DIR / "data" / "sample_resume.txt").read_bytes()
+SAMPLE_JOB = (REPO_DIR / "data" / "sample_job.txt").read_bytes()
+OTHER_JOB = b"""Mobile Developer
+Required Skills:
+- Swift
+- Kotlin
+- Rust
+Minimum 2 years of experience"""
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Keep debug copies of the results out of outputs/
+    monkeypatch.setattr(app_module, 'save_match_result', lambda *args, **kwargs: None)
+    return app_module.app.test_client()
+
+
+def upload(client, resume: bytes, job: bytes):
+    response = client.post('/upload', data={
+        'resume': (io.BytesIO(resume), 'resume.txt'),
+        'job_description': (io.BytesIO(job), 'job.txt'),
+    }, content_type='multipart/form-data')
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()
+
+
+def batch_upload(client, resumes, jobs, **form):
+    return client.post('/batch_upload', data={
+        'resumes': [(io.BytesIO(data), name) for name, data in resumes],
+        'job_descriptions': [(io.BytesIO(data), name) for name, data in jobs],
+        **form,
+    }, content_type='multipart/form-data')
+
+
+def test_batch_upload_scores_equal_upload(client):
+    resumes = [('a.txt', SAMPLE_RESUME), ('b.txt', SAMPLE_RESUME.replace(b'Python', b'Perl'))]
+    jobs = [('job1.txt', SAMPLE_JOB), ('job2.txt', OTHER_JOB)]
+
+    response = batch_upload(client, resumes, jobs)
+
+    assert response.status_code == 200, response.get_json()
+    body = response.get_json()
+    assert (body['resume_count'], body['job_count']) == (2, 2)
+    assert len(body['matches']) == 4
+    scores = [m['match_score'] for m in body['matches']]
+    assert scores == sorted(scores, reverse=True)
+    for match in body['matches']:
+        expected = upload(client, resumes[match['resume_index']][1], jobs[match['job_index']][1])
+        assert match['match_score'] == pytest.approx(expected['match_result']['overall_score'])
+
+
+def test_batch_upload_min_required_matches(client):
+    jobs = [('job1.txt', SAMPLE_JOB), ('job2.txt', OTHER_JOB)]
+    response = batch_upload(client, [('a.txt', SAMPLE_RESUME)], jobs, min_required_matches='2')
+
+    assert response.status_code == 200, response.get_json()
+    assert [m['job_filename'] for m in response.get_json()['matches']] == ['job1.txt']
+
+
+def test_batch_upload_min_required_matches_with_simple_matcher(client, monkeypatch):
+    monkeypatch.setattr(app_module, 'USE_AI_COMPONENTS', False)
+    monkeypatch.setattr(app_module, 'ai_matcher', app_module.SimpleMatcher())
+    jobs = [('job1.txt', SAMPLE_JOB), ('job2.txt', OTHER_JOB)]
+    response = batch_upload(client, [('a.txt', SAMPLE_RESUME)], jobs, min_required_matches='2')
+
+    assert response.status_code == 200, response.get_json()
+    assert [m['job_filename'] for m in response.get_json()['matches']] == ['job1.txt']
+
+
+def test_batch_upload_job_text(client):
+    response = batch_upload(client, [('a.txt', SAMPLE_RESUME)], [], job_text=SAMPLE_JOB.decode())
+    assert response.status_code == 200, response.get_json()
+    assert [m['job_filename'] for m in response.get_json()['matches']] == ['text_input']
+
+
+@pytest.mark.parametrize('resumes, jobs, form', [
+    ([], [('job.txt', SAMPLE_JOB)], {}),
+    ([('a.txt', SAMPLE_RESUME)], [], {}),
+    ([('a.xls', SAMPLE_RESUME)], [('job.txt', SAMPLE_JOB)], {}),
+    ([('a.txt', b'')], [('job.txt', SAMPLE_JOB)], {}),
+    ([(f'{i}.txt', SAMPLE_RESUME) for i in range(app_module.MAX_BATCH_FILES)], [('job.txt', SAMPLE_JOB)], {}),
+])
+def test_batch_upload_rejects_bad_requests(client, resumes, jobs, form):
+    response = batch_upload(client, resumes, jobs, **form)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_extract_texts_process_pool():
+    payloads = [(f'{i}.txt', SAMPLE_RESUME + str(i).encode()) for i in range(app_module._PROCESS_POOL_MIN_FILES)]
+    assert app_module.extract_texts(payloads) == [data.decode() for _, data in payloads]
@@ -0,0 +1,190 @@
+"""
+Batch scoring paths of MatchingEngine checked against per-pair match()
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import _kernels
+import matcher
+from matcher import MatchingEngine
+
+
+def make_corpus(n_jobs: int, vocab_size: int, seed: int = 0):
+    """A random resume and n_jobs job descriptions over vocab_size skills"""
+    rng = np.random.default_rng(seed)
+    vocab = [f"skill {i}" for i in range(vocab_size)]
+
+    def pick(low: int, high: int):
+        return [vocab[i] for i in rng.choice(vocab_size, rng.integers(low, high), replace=False)]
+
+    resume = {
+        'skills': pick(5, 40),
+        'experience_years': int(rng.integers(0, 10)),
+        'education': ['Bachelor of Science in Computer Science'],
+    }
+    jobs = [{
+        # Some jobs have no required or no preferred skills at all
+        'required_skills': pick(0, 12),
+        'preferred_skills': pick(0, 8),
+        'experience_required': int(rng.integers(0, 8)),
+        'education_required': ['bachelor'] if rng.random() < 0.5 else [],
+    } for _ in range(n_jobs)]
+    return resume, jobs, rng.uniform(-0.2, 1.0, n_jobs)
+
+
+def check_score_corpus(engine: MatchingEngine, vocab_size: int) -> None:
+    """score_corpus equals match()['overall_score'] for every job"""
+    resume, jobs, semantic = make_corpus(200, vocab_size)
+    # Make sure some resume skills actually appear in the jobs
+    jobs[0]['required_skills'] = resume['skills'][:3]
+
+    scores = engine.score_corpus(resume, jobs, semantic)
+    expected = [engine.match(resume, job, semantic_score=s)['overall_score']
+                for job, s in zip(jobs, semantic)]
+    np.testing.assert_allclose(scores, expected, rtol=0, atol=1e-9)
+
+
+def test_score_corpus_bitset_path():
+    engine = MatchingEngine()
+    check_score_corpus(engine, vocab_size=300)
+    assert len(engine._skill_vocab) <= matcher._BITSET_MAX_VOCAB
+
+
+def test_score_corpus_sorted_merge_path(monkeypatch):
+    # Vocabulary above the bitset limit: sorted-id intersections instead
+    monkeypatch.setattr(matcher, '_BITSET_MAX_VOCAB', 16)
+    engine = MatchingEngine()
+    check_score_corpus(engine, vocab_size=300)
+    assert len(engine._skill_vocab) > matcher._BITSET_MAX_VOCAB
+
+
+def test_score_corpus_without_semantic_scores():
+    engine = MatchingEngine()
+    resume, jobs, _ = make_corpus(20, 50, seed=1)
+    expected = [engine.match(resume, job, semantic_score=0.0)['overall_score'] for job in jobs]
+    np.testing.assert_allclose(engine.score_corpus(resume, jobs), expected, rtol=0, atol=1e-9)
+
+
+def test_score_corpus_empty_corpus():
+    resume, _, _ = make_corpus(0, 50)
+    assert MatchingEngine().score_corpus(resume, []).shape == (0,)
+
+
+@pytest.mark.parametrize('bitset_max_vocab', [matcher._BITSET_MAX_VOCAB, 16])
+def test_shortlist_matches_required_skill_counts(monkeypatch, bitset_max_vocab):
+    monkeypatch.setattr(matcher, '_BITSET_MAX_VOCAB', bitset_max_vocab)
+    engine = MatchingEngine()
+    resume, jobs, semantic = make_corpus(100, 200, seed=2)
+    resume_embedding = np.array([1.0, 0.0], dtype=np.float32)
+    job_embeddings = np.stack([[s, np.sqrt(1 - s * s)] for s in np.clip(semantic, -1, 1)]).astype(np.float32)
+
+    shortlisted = engine.shortlist(resume, jobs, 2, resume_embedding, job_embeddings)
+
+    expected = [j for j, job in enumerate(jobs)
+                if not job['required_skills'] or len(engine.calculate_skill_score(
+                    resume['skills'], job['required_skills'], [])['required_matches']) >= 2]
+    assert [j for j, _ in shortlisted] == expected
+    # Semantic scores only for survivors, clamped at 0 like match()
+    for j, score in shortlisted:
+        assert score == pytest.approx(max(float(job_embeddings[j] @ resume_embedding), 0.0), abs=1e-6)
+
+
+def test_match_resume_vs_corpus_skill_scores():
+    engine = MatchingEngine()
+    resume, jobs, _ = make_corpus(50, 100, seed=3)
+    engine.build_skill_index(jobs)
+
+    results = engine.match_resume_vs_corpus(resume['skills'], min_required_matches=1)
+
+    scores = {result['job_index']: result['skill_score'] for result in results}
+    for j, job in enumerate(jobs):
+        skill_result = engine.calculate_skill_score(
+            resume['skills'], job['required_skills'], job['preferred_skills'])
+        if job['required_skills'] and not skill_result['required_matches']:
+            assert j not in scores
+        else:
+            assert scores[j] == pytest.approx(skill_result['score'])
+    assert [r['skill_score'] for r in results] == sorted(scores.values(), reverse=True)
+
+
+def test_match_resume_vs_corpus_needs_index():
+    with pytest.raises(ValueError):
+        MatchingEngine().match_resume_vs_corpus(['python'])
+
+
+def test_kernels_without_numba():
+    # The njit stand-in must leave every kernel working as plain Python
+    script = (
+        "import sys\n"
+        "sys.modules['numba'] = None\n"
+        f"sys.path.insert(0, {str(Path(__file__).resolve().parent)!r})\n"
+        "import test_matcher\n"
+        "assert not test_matcher._kernels.HAVE_NUMBA\n"
+        "test_matcher.check_score_corpus(test_matcher.MatchingEngine(), 300)\n"
+        "test_matcher.matcher._BITSET_MAX_VOCAB = 16\n"
+        "test_matcher.check_score_corpus(test_matcher.MatchingEngine(), 300)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_cos_sim_kernel():
+    a = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+    b = np.array([-2.0, 0.5, 4.0], dtype=np.float32)
+    expected = float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+    assert _kernels.cos_sim(a, b) == pytest.approx(expected, rel=1e-6)
+    assert _kernels.cos_sim(a, np.zeros(3, dtype=np.float32)) == 0.0
+
+
+def make_resumes(n: int, seed: int = 4):
+    """n random resumes against one job; every resume appears twice, so scores tie"""
+    rng = np.random.default_rng(seed)
+    resume, jobs, _ = make_corpus(1, 60, seed)
+    resumes = []
+    for _ in range(n // 2):
+        skills = list(rng.choice(jobs[0]['required_skills'] + jobs[0]['preferred_skills'] + resume['skills'],
+                                 rng.integers(1, 10)))
+        resume_data = {'skills': skills, 'experience_years': int(rng.integers(0, 10)), 'education': []}
+        resumes += [resume_data, dict(resume_data)]
+    embeddings = list(rng.standard_normal((len(resumes), 8)).astype(np.float32))
+    return resumes, jobs[0], embeddings, rng.standard_normal(8).astype(np.float32)
+
+
+def test_batch_match_workers_match_serial():
+    engine = MatchingEngine()
+    resumes, job, embeddings, job_embedding = make_resumes(40)
+
+    serial = engine.batch_match(resumes, job, embeddings, job_embedding)
+    parallel = engine.batch_match(resumes, job, embeddings, job_embedding, workers=2)
+
+    assert [r['resume_index'] for r in parallel] == [r['resume_index'] for r in serial]
+    assert [r['match_score'] for r in parallel] == [r['match_score'] for r in serial]
+    assert parallel[0]['details'] == serial[0]['details']
+
+
+@pytest.mark.parametrize('top_k', [0, 1, 5, 7, 40, 100])
+def test_batch_match_top_k_is_prefix_of_full_ranking(top_k):
+    engine = MatchingEngine()
+    resumes, job, embeddings, job_embedding = make_resumes(40)
+
+    full = engine.batch_match(resumes, job, embeddings, job_embedding, include_details=False)
+    top = engine.batch_match(resumes, job, embeddings, job_embedding, include_details=False, top_k=top_k)
+
+    # Ties at the cut-off keep the earliest resumes, as the stable full sort does
+    assert [r['resume_index'] for r in top] == [r['resume_index'] for r in full[:top_k]]
+
+
+def test_batch_match_scores_equal_match():
+    engine = MatchingEngine()
+    resumes, job, _, _ = make_resumes(10)
+    results = engine.batch_match(resumes, job, include_details=False)
+    for result in results:
+        expected = engine.match(resumes[result['resume_index']], job)['overall_score']
+        assert result['match_score'] == pytest.approx(expected)
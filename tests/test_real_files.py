@@ -2,69 +2,222 @@
 """
 Test with real PDF/DOCX files
 """
+import hashlib
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-sys.path.append(str(Path(__file__).parent))
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / "src"))
 
 from document_parser import DocumentParser
 from embedding_generator import EmbeddingGenerator
-from matcher import ResumeJobMatcher
-from ai_explainer import AIExplainer
-from src.utils import safe_read_file, print_match_summary
+from matcher import MatchingEngine
+from utils import safe_read_file, safe_mmap_file, print_match_summary
 
-def test_with_files(resume_path: str, job_path: str):
-    """Test with actual files"""
-    parser = DocumentParser()
-    
-    # Read files
-    resume_content = safe_read_file(resume_path)
-    job_content = safe_read_file(job_path)
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_BYTES = 1 << 20
+
+# A document as a file path, or as in-memory (contents, file type)
+DocumentSource = Union[str, Tuple[bytes, str]]
+
+# A job description prepared ahead of time: (job_text, job_data, job_embedding)
+PreparedJob = Tuple[str, Dict[str, Any], np.ndarray]
+
+# Embeddings of sample texts are kept here between runs
+EMBEDDING_CACHE_DIR = Path(".cache/emb")
+
+def embedding_cache_file(embedder: EmbeddingGenerator, text: str) -> Path:
+    """
+    Cache file for text, keyed by a hash of the model variant, output dtype
+    and text (int8 and float16 embeddings differ from full precision ones)
+    """
+    variant = f"{embedder._model_key}:{embedder.dtype.name}"
+    key = hashlib.sha256((variant + text[:2000]).encode()).hexdigest()
+    return EMBEDDING_CACHE_DIR / f"{key}.npy"
+
+def cached_embed(embedder: EmbeddingGenerator, texts: List[str]) -> List[np.ndarray]:
+    """
+    Embeddings of texts, loaded from disk if this model embedded them before;
+    the rest are encoded together in one batch and saved
+    """
+    cache_files = [embedding_cache_file(embedder, text) for text in texts]
+    embeddings = [np.load(path) if path.exists() else None for path in cache_files]
     
-    if not resume_content or not job_content:
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if missing:
+        batch = embedder.get_embeddings_batch([texts[i] for i in missing], batch_size=len(missing))
+        # Fallback embeddings (model not loaded) are not model output; don't keep them
+        save = embedder.model is not None
+        if save:
+            EMBEDDING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for i, embedding in zip(missing, batch):
+            if save:
+                # Keyed again: the variant that loaded may differ from the one requested
+                np.save(embedding_cache_file(embedder, texts[i]), embedding)
+            embeddings[i] = embedding
+    return embeddings
+
+# Components are built once per process and reused by every test_with_files call
+@lru_cache(maxsize=1)
+def _parser() -> DocumentParser:
+    return DocumentParser()
+
+@lru_cache(maxsize=1)
+def _embedder() -> EmbeddingGenerator:
+    # int8 model (ONNX, else torch on CPU) and float16 vectors are enough for a smoke test
+    return EmbeddingGenerator(backend="onnx", quantized=True, torch_int8=True, dtype=np.float16)
+
+@lru_cache(maxsize=1)
+def _matcher() -> MatchingEngine:
+    # EmbeddingGenerator hands out unit-length vectors (also what the caches
+    # store), so similarity is a plain dot product
+    return MatchingEngine(prenormalized=EmbeddingGenerator.normalized)
+
+def read_document(source: DocumentSource):
+    """
+    (contents, file type) for extract_text. In-memory sources are used as
+    given; files are read-only mmaps when large, else bytes
+    """
+    if isinstance(source, tuple):
+        return source
+    file_type = source.rpartition('.')[2].lower()
+    try:
+        large = os.path.getsize(source) >= MMAP_MIN_BYTES
+    except OSError:
+        large = False  # safe_read_file reports the error
+    if large:
+        return safe_mmap_file(source), file_type
+    return safe_read_file(source), file_type
+
+def prepare_job(job_path: DocumentSource) -> Optional[PreparedJob]:
+    """Extract, parse and embed a job description once, for reuse across tests"""
+    parser = _parser()
+    job_content, job_type = read_document(job_path)
+    if not job_content:
         print("Error reading files")
-        return
-    
-    # Get file types
-    resume_type = resume_path.split('.')[-1].lower()
-    job_type = job_path.split('.')[-1].lower()
+        return None
     
-    # Extract text
-    resume_text = parser.extract_text(resume_content, resume_type)
     job_text = parser.extract_text(job_content, job_type)
-    
-    # Parse data
-    resume_data = parser.parse_resume(resume_text)
+    if hasattr(job_content, 'close'):
+        job_content.close()
     job_data = parser.parse_job_description(job_text)
+    job_embedding, = cached_embed(_embedder(), [job_text[:2000]])
+    return job_text, job_data, job_embedding
+
+def test_with_files(resume_path: DocumentSource, job_path: DocumentSource,
+                    job: Optional[PreparedJob] = None):
+    """
+    Test with actual files, or in-memory (contents, file type) documents.
+    job is the prepare_job() result for job_path, if already available; the
+    job document is then not read again
+    """
+    return run_files_batch([(resume_path, job_path)], job=job)[0]
+
+# A script helper taking file arguments, not a pytest test
+test_with_files.__test__ = False
+
+def run_files_batch(pairs: List[Tuple[DocumentSource, DocumentSource]],
+                    job: Optional[PreparedJob] = None) -> List[Optional[Dict[str, Any]]]:
+    """
+    Test many (resume, job) document pairs. Each distinct document is read,
+    extracted and parsed once, and all texts are embedded in one batch
+    (encode() sorts them by length, so batches carry little padding). job is
+    the prepare_job() result shared by every pair, if already available.
+    Pairs whose documents cannot be read give None
+    """
+    parser = _parser()
+    resume_sources = list(dict.fromkeys(resume for resume, _ in pairs))
+    job_sources = [] if job is not None else list(dict.fromkeys(job_source for _, job_source in pairs))
+    sources = resume_sources + job_sources
+    
+    # Read files (contents and file types)
+    documents = [read_document(source) for source in sources]
+    readable = [i for i, (content, _) in enumerate(documents) if content]
+    
+    def extract(i: int) -> str:
+        return parser.extract_text(*documents[i])
+    
+    def parse(i: int) -> Dict[str, Any]:
+        if i < len(resume_sources):
+            return parser.parse_resume(texts[i])
+        return parser.parse_job_description(texts[i])
+    
+    texts: List[str] = [""] * len(sources)
+    parsed: List[Optional[Dict[str, Any]]] = [None] * len(sources)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        # The embedding model loads in the background while the documents are
+        # processed; leaving the pool waits for it
+        pool.submit(_embedder().load)
+        
+        # Extract text (all documents at once)
+        for i, text in zip(readable, pool.map(extract, readable)):
+            texts[i] = text
+        for content, _ in documents:
+            if hasattr(content, 'close'):
+                content.close()
+        
+        # Parse data
+        for i, data in zip(readable, pool.map(parse, readable)):
+            parsed[i] = data
     
     # Continue with matching...
-    embedder = EmbeddingGenerator()
-    matcher = ResumeJobMatcher()
+    embedder = _embedder()
+    matcher = _matcher()
     
-    # Generate embeddings
-    resume_embedding = embedder.get_embedding(resume_text[:2000])  # Limit text for speed
-    job_embedding = embedder.get_embedding(job_text[:2000])
+    # Generate embeddings (one batch; text limited for speed)
+    embeddings: List[Optional[np.ndarray]] = [None] * len(sources)
+    for i, embedding in zip(readable, cached_embed(embedder, [texts[i][:2000] for i in readable])):
+        embeddings[i] = embedding
     
-    # Calculate match
-    match_result = matcher.match(
-        resume_data, 
-        job_data, 
-        resume_embedding, 
-        job_embedding
-    )
+    resume_index = {source: i for i, source in enumerate(resume_sources)}
+    job_index = {source: len(resume_sources) + i for i, source in enumerate(job_sources)}
     
-    print_match_summary(match_result)
+    results = []
+    for resume_source, job_source in pairs:
+        r = resume_index[resume_source]
+        if job is None:
+            j = job_index[job_source]
+            job_data, job_embedding = parsed[j], embeddings[j]
+        else:
+            _, job_data, job_embedding = job
+        
+        if parsed[r] is None or job_data is None:
+            print("Error reading files")
+            results.append(None)
+            continue
+        
+        # Calculate match
+        match_result = matcher.match(
+            parsed[r], 
+            job_data, 
+            embeddings[r], 
+            job_embedding
+        )
+        
+        print_match_summary(match_result)
+        results.append(match_result)
     
-    return match_result
+    return results
 
 if __name__ == "__main__":
+    # Size torch's CPU thread pools before the model is loaded; some containers
+    # default to a single intra-op thread
+    try:
+        import torch
+        torch.set_num_threads(os.cpu_count() or 4)
+        torch.set_num_interop_threads(2)
+    except (ImportError, RuntimeError):
+        pass
+    
     # Example usage
     print("Testing with sample files...")
     
-    # Create sample files if they don't exist
-    import os
-    
-    # Create a sample resume text file
+    # Sample resume text
     sample_resume = """John Smith
 Software Engineer
 john.smith@email.com
@@ -94,7 +247,7 @@ CERTIFICATIONS:
 AWS Certified Solutions Architect
 Python Institute Certified"""
 
-    # Create a sample job description text file
+    # Sample job description text
     sample_job = """Software Engineer (Python)
 
 Job Description:
@@ -126,16 +279,11 @@ Bachelor's degree in Computer Science or related field
 Experience:
 Minimum 3 years of software development experience"""
 
-    # Save sample files
-    with open("sample_resume.txt", "w") as f:
-        f.write(sample_resume)
-    
-    with open("sample_job.txt", "w") as f:
-        f.write(sample_job)
-    
-    print("Created sample files: sample_resume.txt, sample_job.txt")
+    # The samples are passed in memory, so nothing is written to or read from disk
+    resume_source = (sample_resume.encode(), "txt")
+    job_source = (sample_job.encode(), "txt")
     
-    # Test with the sample files
-    result = test_with_files("sample_resume.txt", "sample_job.txt")
+    # Test with the samples
+    result = test_with_files(resume_source, job_source)
     
     print("\n✅ Test completed!")
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+save_results writes the same data with and without orjson
+"""
+import math
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import utils
+from utils import load_results, save_results
+
+
+@dataclass
+class Candidate:
+    name: str
+    score: float
+
+
+RESULTS = {
+    'overall_score': np.float32(82.3),
+    'count': np.int64(3),
+    'scores': np.array([0.1, 0.25], dtype=np.float32),
+    'matrix': np.arange(4, dtype=np.int32).reshape(2, 2),
+    'nested': {'pairs': [(1, np.float64(0.5)), ('a', [np.bool_(True)])]},
+    'saved_at': datetime(2024, 5, 17, 9, 30, 15),
+    'day': date(2024, 5, 17),
+    'candidate': Candidate('Ada', 91.5),
+    'path': Path('outputs/result.json'),
+    'name': 'Zoë',
+}
+
+
+def saved(tmp_path, results, use_orjson: bool, monkeypatch, **kwargs):
+    """Data save_results wrote, with orjson enabled or disabled"""
+    if not use_orjson:
+        monkeypatch.setattr(utils, 'orjson', None)
+    path = tmp_path / f"orjson_{use_orjson}.json"
+    assert save_results(results, str(path), **kwargs)
+    monkeypatch.undo()
+    return load_results(str(path))['results']
+
+
+@pytest.mark.skipif(utils.orjson is None, reason="orjson not installed")
+@pytest.mark.parametrize('indent', [None, 2])
+def test_orjson_and_json_paths_agree(tmp_path, monkeypatch, indent):
+    with_orjson = saved(tmp_path, RESULTS, True, monkeypatch, indent=indent)
+    with_json = saved(tmp_path, RESULTS, False, monkeypatch, indent=indent)
+    assert with_orjson == with_json
+    assert with_orjson['saved_at'] == str(RESULTS['saved_at'])
+    assert with_orjson['scores'] == [float(np.float32(0.1)), 0.25]
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_non_finite_scores_are_kept(tmp_path, monkeypatch, use_orjson):
+    results = {'scores': [1.0, float('nan')], 'best': np.float64('inf'), 'all': np.array([np.nan])}
+    data = saved(tmp_path, results, use_orjson, monkeypatch)
+    assert math.isnan(data['scores'][1])
+    assert data['best'] == math.inf
+    assert math.isnan(data['all'][0])
+
+
+def test_has_non_finite():
+    assert not utils._has_non_finite(RESULTS)
+    assert utils._has_non_finite({'a': [(1, float('nan'))]})
+    assert utils._has_non_finite({'a': np.array([[1.0, -np.inf]])})
+    assert not utils._has_non_finite({'a': np.array([1, 2])})